@@ -17,8 +17,16 @@ def main():
     # Check if production mode
     is_prod = len(sys.argv) > 1 and sys.argv[1] == "prod"
 
+    # uvloop ships with uvicorn[standard] everywhere except Windows.
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+
     uvicorn.run(
-        "src.main:app", host=host, port=port, reload=not is_prod, env_file=".env"
+        "src.main:app",
+        host=host,
+        port=port,
+        reload=not is_prod,
+        env_file=".env",
+        loop=loop,
     )
 
 
@@ -5,99 +5,127 @@ This module provides centralized error handling following FastAPI best practices
 All exceptions are transformed into consistent JSON responses with trace IDs.
 """
 
-from logging import getLogger
+from collections.abc import Mapping, Sequence
+from logging import ERROR, WARNING, getLogger
 from typing import Any
 
-from fastapi import HTTPException, Request, status
+import orjson
+from fastapi import HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.core.exceptions import BaseAppException
+from src.shared.response import FastORJSONResponse
 
 logger = getLogger(__name__)
 
+# The unhandled-error body is constant apart from the trace ID, so it is
+# serialized once and the trace ID is spliced in per request.
+_UNHANDLED_ERROR_BODY = orjson.dumps(
+    {
+        "success": False,
+        "error": {
+            "type": "InternalServerError",
+            "message": "An unexpected error occurred. Please try again later.",
+            "trace_id": None,
+        },
+    }
+)
+_NULL_TRACE_ID = b'"trace_id":null'
+
+
+def _request_state(request: Request) -> Mapping[str, Any]:
+    """
+    Return the dict backing ``request.state``.
+
+    Starlette keeps request state in ``scope["state"]``; reading it directly
+    avoids ``State.__getattr__`` raising and catching AttributeError for
+    every missing key.
+    """
+    return request.scope.get("state") or {}
+
 
 async def base_app_exception_handler(
     request: Request, exc: BaseAppException
-) -> JSONResponse:
+) -> FastORJSONResponse:
     """
     Handle custom application exceptions.
 
     Transforms BaseAppException and its subclasses into consistent JSON responses
     with proper HTTP status codes, trace IDs, and context information.
     """
-    trace_id = getattr(request.state, "trace_id", None)
-
-    # Log the exception for monitoring
-    logger.error(
-        "Application exception occurred",
-        extra={
-            "trace_id": trace_id,
-            "exception_type": exc.__class__.__name__,
-            "status_code": exc.status_code,
-            "detail": exc.detail,
-            "context": exc.context,
-            "path": request.url.path,
-            "method": request.method,
-        },
-        exc_info=True,
-    )
-
-    # Prepare retry information if applicable
-    retry_info: dict[str, Any] | None = None
-    if hasattr(exc, "retryable") and exc.retryable:
-        retry_info = {
-            "retryable": True,
-            "retry_after": getattr(exc, "retry_after", None),
-            "max_retries": getattr(exc, "max_retries", 3),
-            "current_attempt": getattr(request.state, "retry_attempt", 1),
-        }
+    state = _request_state(request)
+    trace_id = state.get("trace_id")
+
+    # Log the exception for monitoring; skip building the extra dict when the
+    # level is disabled. Records are enqueued and written by the log listener.
+    if logger.isEnabledFor(ERROR):
+        logger.error(
+            "Application exception occurred",
+            extra={
+                "trace_id": trace_id,
+                "exception_type": exc.__class__.__name__,
+                "status_code": exc.status_code,
+                "detail": exc.detail,
+                "context": exc.context,
+                "path": request.url.path,
+                "method": request.method,
+            },
+            exc_info=True,
+        )
 
-    response_content: dict[str, Any] = {
-        "success": False,
-        "error": {
-            "type": exc.__class__.__name__,
-            "message": exc.get_i18n_message(),
-            "trace_id": trace_id,
-            "context": exc.context if exc.context else None,
-        },
+    error: dict[str, Any] = {
+        "type": exc.__class__.__name__,
+        "message": exc.get_i18n_message(),
+        "trace_id": trace_id,
+        "context": exc.context or None,
     }
 
-    # Include i18n information if available
-    if hasattr(exc, "i18n_key") and exc.i18n_key:
-        response_content["error"]["i18n_key"] = exc.i18n_key
-    if hasattr(exc, "i18n_params") and exc.i18n_params:
-        response_content["error"]["i18n_params"] = exc.i18n_params
+    # BaseAppException.__init__ always sets the i18n and retry attributes, so
+    # they are read directly instead of probed.
+    if exc.i18n_key:
+        error["i18n_key"] = exc.i18n_key
+    if exc.i18n_params:
+        error["i18n_params"] = exc.i18n_params
+
+    response_content: dict[str, Any] = {"success": False, "error": error}
 
-    if retry_info:
-        response_content["retry_info"] = retry_info
+    if exc.retryable:
+        response_content["retry_info"] = {
+            "retryable": True,
+            "retry_after": exc.retry_after,
+            "max_retries": exc.max_retries,
+            "current_attempt": state.get("retry_attempt", 1),
+        }
 
-    return JSONResponse(
-        status_code=exc.status_code, content=response_content, headers=exc.headers or {}
+    return FastORJSONResponse(
+        status_code=exc.status_code, content=response_content, headers=exc.headers
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(
+    request: Request, exc: HTTPException
+) -> FastORJSONResponse:
     """
     Handle FastAPI HTTP exceptions.
 
     Provides consistent error response format for built-in FastAPI HTTP exceptions.
     """
-    trace_id = getattr(request.state, "trace_id", None)
+    trace_id = _request_state(request).get("trace_id")
 
-    logger.warning(
-        "HTTP exception occurred",
-        extra={
-            "trace_id": trace_id,
-            "status_code": exc.status_code,
-            "detail": exc.detail,
-            "path": request.url.path,
-            "method": request.method,
-        },
-    )
+    if logger.isEnabledFor(WARNING):
+        logger.warning(
+            "HTTP exception occurred",
+            extra={
+                "trace_id": trace_id,
+                "status_code": exc.status_code,
+                "detail": exc.detail,
+                "path": request.url.path,
+                "method": request.method,
+            },
+        )
 
-    return JSONResponse(
+    return FastORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -110,41 +138,54 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     )
 
 
+def format_validation_errors(
+    errors: Sequence[Mapping[str, Any]],
+) -> list[dict[str, Any]]:
+    """
+    Flatten Pydantic validation errors into user-friendly detail entries.
+
+    Args:
+        errors: Error dicts as returned by ``RequestValidationError.errors()``
+
+    Returns:
+        One entry per error with the location joined into a ``field`` path
+    """
+    return [
+        {
+            "field": " -> ".join(map(str, error["loc"])),
+            "message": error["msg"],
+            "type": error["type"],
+            "input": error.get("input"),
+        }
+        for error in errors
+    ]
+
+
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> FastORJSONResponse:
     """
     Handle request validation errors.
 
     Transforms Pydantic validation errors into user-friendly error messages
     while maintaining detailed error information for debugging.
     """
-    trace_id = getattr(request.state, "trace_id", None)
-
-    # Extract validation errors with more user-friendly formatting
-    errors = []
-    for error in exc.errors():
-        field_path = " -> ".join(str(loc) for loc in error["loc"])
-        errors.append(
-            {
-                "field": field_path,
-                "message": error["msg"],
-                "type": error["type"],
-                "input": error.get("input"),
-            }
-        )
+    trace_id = _request_state(request).get("trace_id")
 
-    logger.warning(
-        "Request validation failed",
-        extra={
-            "trace_id": trace_id,
-            "errors": errors,
-            "path": request.url.path,
-            "method": request.method,
-        },
-    )
+    errors = format_validation_errors(exc.errors())
 
-    return JSONResponse(
+    if logger.isEnabledFor(WARNING):
+        logger.warning(
+            "Request validation failed",
+            extra={
+                "trace_id": trace_id,
+                "errors": errors,
+                "path": request.url.path,
+                "method": request.method,
+            },
+        )
+
+    return FastORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "success": False,
@@ -160,27 +201,28 @@ async def validation_exception_handler(
 
 async def starlette_http_exception_handler(
     request: Request, exc: StarletteHTTPException
-) -> JSONResponse:
+) -> FastORJSONResponse:
     """
     Handle Starlette HTTP exceptions.
 
     Catches HTTP exceptions that might escape from Starlette middleware
     and provides consistent error formatting.
     """
-    trace_id = getattr(request.state, "trace_id", None)
+    trace_id = _request_state(request).get("trace_id")
 
-    logger.warning(
-        "Starlette HTTP exception occurred",
-        extra={
-            "trace_id": trace_id,
-            "status_code": exc.status_code,
-            "detail": exc.detail,
-            "path": request.url.path,
-            "method": request.method,
-        },
-    )
+    if logger.isEnabledFor(WARNING):
+        logger.warning(
+            "Starlette HTTP exception occurred",
+            extra={
+                "trace_id": trace_id,
+                "status_code": exc.status_code,
+                "detail": exc.detail,
+                "path": request.url.path,
+                "method": request.method,
+            },
+        )
 
-    return JSONResponse(
+    return FastORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -193,39 +235,48 @@ async def starlette_http_exception_handler(
     )
 
 
-async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Handle unexpected exceptions.
 
     Catches any unhandled exceptions and provides a generic error response
     while logging the full exception details for investigation.
     """
-    trace_id = getattr(request.state, "trace_id", None)
-
-    logger.error(
-        "Unhandled exception occurred",
-        extra={
-            "trace_id": trace_id,
-            "exception_type": exc.__class__.__name__,
-            "path": request.url.path,
-            "method": request.method,
-        },
-        exc_info=True,
-    )
+    trace_id = _request_state(request).get("trace_id")
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "success": False,
-            "error": {
-                "type": "InternalServerError",
-                "message": "An unexpected error occurred. Please try again later.",
+    if logger.isEnabledFor(ERROR):
+        logger.error(
+            "Unhandled exception occurred",
+            extra={
                 "trace_id": trace_id,
+                "exception_type": exc.__class__.__name__,
+                "path": request.url.path,
+                "method": request.method,
             },
-        },
+            exc_info=True,
+        )
+
+    body = _UNHANDLED_ERROR_BODY
+    if trace_id is not None:
+        body = body.replace(_NULL_TRACE_ID, b'"trace_id":' + orjson.dumps(trace_id))
+
+    return Response(
+        content=body,
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        media_type="application/json",
     )
 
 
+# Exception classes paired with their handlers, in registration order.
+_EXCEPTION_HANDLERS: tuple[tuple[type[Exception], Any], ...] = (
+    (BaseAppException, base_app_exception_handler),
+    (HTTPException, http_exception_handler),
+    (RequestValidationError, validation_exception_handler),
+    (StarletteHTTPException, starlette_http_exception_handler),
+    (Exception, unhandled_exception_handler),
+)
+
+
 def register_exception_handlers(app) -> None:
     """
     Register all exception handlers with the FastAPI application.
@@ -233,8 +284,5 @@ def register_exception_handlers(app) -> None:
     Args:
         app: FastAPI application instance
     """
-    app.add_exception_handler(BaseAppException, base_app_exception_handler)
-    app.add_exception_handler(HTTPException, http_exception_handler)
-    app.add_exception_handler(RequestValidationError, validation_exception_handler)
-    app.add_exception_handler(StarletteHTTPException, starlette_http_exception_handler)
-    app.add_exception_handler(Exception, unhandled_exception_handler)
+    for exc_class, handler in _EXCEPTION_HANDLERS:
+        app.add_exception_handler(exc_class, handler)
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
-from fastmcp import FastMCP
+import time
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Any
+
+from fastmcp import Context, FastMCP
+from fastmcp.exceptions import ToolError
 from fastmcp.server.auth import StaticTokenVerifier
+from pydantic import ValidationError
 
 from src.config import settings
 from src.core.logging import get_logger
@@ -24,13 +31,95 @@ from src.usecases.mcp.mcp_usecase import (
 
 logger = get_logger(__name__)
 
+# Read-only tool results are reused for this long; reload tools and the REST
+# mutation endpoints clear them early.
+_TOOL_CACHE_TTL_SECONDS = 30.0
+_TOOL_CACHE_MAXSIZE = 128
+_tool_cache: dict[tuple[str, ...], tuple[float, Any]] = {}
+
 
+@lru_cache(maxsize=1)
 def get_mcp_manager() -> mcp_manager.MCPManager:
     return mcp_manager.MCPManager()
 
 
+@lru_cache(maxsize=1)
 def get_agent_factory() -> ConversationAgentFactory:
-    return ConversationAgentFactory()
+    return ConversationAgentFactory.default()
+
+
+def _cached_tool_result[T](key: tuple[str, ...], producer: Callable[[], T]) -> T:
+    """Return a cached read-only tool result, calling ``producer`` on a miss.
+
+    Results carrying an ``error`` are not cached so failures are retried on
+    the next call.
+    """
+    now = time.monotonic()
+    cached = _tool_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    result = producer()
+    if getattr(result, "error", None) is None:
+        _store_tool_result(key, now, result)
+    return result
+
+
+def _store_tool_result(key: tuple[str, ...], now: float, result: Any) -> None:
+    """Cache ``result``, purging expired entries and evicting the oldest."""
+    _tool_cache.pop(key, None)
+    if len(_tool_cache) >= _TOOL_CACHE_MAXSIZE:
+        for stale_key in [k for k, (expiry, _) in _tool_cache.items() if expiry <= now]:
+            del _tool_cache[stale_key]
+        while len(_tool_cache) >= _TOOL_CACHE_MAXSIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del _tool_cache[next(iter(_tool_cache))]
+    _tool_cache[key] = (now + _TOOL_CACHE_TTL_SECONDS, result)
+
+
+def clear_tool_cache() -> None:
+    """Drop all cached read-only tool results."""
+    _tool_cache.clear()
+
+
+def _parse_tool_selections(
+    tools: list[dict] | None,
+) -> list[MCPToolSelection] | None:
+    """Validate the chat tool's ``tools`` argument into selections.
+
+    The tool schema only declares ``list[dict]``, so each entry is validated
+    here; invalid entries are reported to the caller as a tool error.
+    """
+    if not tools:
+        return None
+    try:
+        return [MCPToolSelection.model_validate(tool_dict) for tool_dict in tools]
+    except ValidationError as exc:
+        raise ToolError(f"Invalid tools selection: {exc}") from exc
+
+
+def _progress_reporter(
+    ctx: Context | None,
+) -> Callable[[str], Awaitable[None]] | None:
+    """Build a callback relaying reply deltas as MCP progress notifications.
+
+    Returns None when the caller did not request progress, so the reply is
+    generated in one shot instead of streamed.
+    """
+    if ctx is None:
+        return None
+    meta = ctx.request_context.meta
+    if meta is None or meta.progressToken is None:
+        return None
+
+    progress = 0
+
+    async def report(delta: str) -> None:
+        nonlocal progress
+        progress += 1
+        await ctx.report_progress(progress=progress, message=delta)
+
+    return report
 
 
 # --- Authentication Setup ---
@@ -77,13 +166,29 @@ def initialize_mcp_server():
     )
 
     # --- MCP Tools (Thin wrappers around use cases) ---
-    _register_mcp_tools(mcp_server)
+    agent_factory = get_agent_factory()
+    management_usecase = MCPServerManagementUsecase(
+        mcp_manager=get_mcp_manager(), agent_factory=agent_factory
+    )
+    _register_mcp_tools(
+        mcp_server,
+        management_usecase=management_usecase,
+        agent_factory=agent_factory,
+    )
 
     return mcp_server
 
 
-def _register_mcp_tools(server: FastMCP):
-    """Register all MCP tools on the server instance."""
+def _register_mcp_tools(
+    server: FastMCP,
+    management_usecase: MCPServerManagementUsecase,
+    agent_factory: ConversationAgentFactory,
+):
+    """Register all MCP tools on the server instance.
+
+    The use cases are built once here and shared by every tool call.
+    """
+    chat_usecase = MCPChatUsecase(agent_factory=agent_factory)
 
     @server.tool
     async def chat(
@@ -91,11 +196,12 @@ def _register_mcp_tools(server: FastMCP):
         model_key: str = "",
         conversation_id: str = "",
         user_id: str = "peer-caller",
-        tools: list[dict] = [],
+        tools: list[dict] | None = None,
         sessionId: str = "",
         action: str = "",
         chatInput: str = "",
         toolCallId: str = "",
+        ctx: Context | None = None,
     ) -> MCPChatResponse:
         """呼叫此功能前，請先依序查詢
         - list_available_models
@@ -113,36 +219,34 @@ def _register_mcp_tools(server: FastMCP):
             model_key (str): 可選的 LLM 模型鍵，如果不指定則使用預設模型。
             conversation_id (str): 可選的對話 ID，用於維持上下文和多輪對話。
             user_id (str): 用戶 ID，預設為 "peer-caller"。
-            tools (list[dict]): 可選的工具選擇列表，
+            tools (list[dict] | None): 可選的工具選擇列表，
                 每個 dict 包含 'server' 和可選的 'functions'。
             sessionId (str): n8n 會話 ID。
             action (str): n8n 動作。
             chatInput (str): n8n 對話輸入。
             toolCallId (str): n8n 工具呼叫 ID。
 
+        若呼叫端在請求中附上 progressToken，回覆會以串流方式產生，
+        每段文字透過 progress 通知即時送出，最終結果仍包含完整回覆。
+
         Returns:
             MCPChatResponse: 包含對話回應的 Pydantic 模型，包括 AI 的回覆、對話 ID 等。
         """
         logger.info("MCP tool 'chat' called by user=%s", user_id)
-        agent_factory = get_agent_factory()
-        chat_usecase = MCPChatUsecase(agent_factory=agent_factory)
 
         # Handle empty strings as None for the use case
         actual_model_key = model_key if model_key else None
         actual_conversation_id = conversation_id if conversation_id else None
 
-        # Convert tools dict to MCPToolSelection list
-        tool_selections = None
-        if tools:
-            tool_selections = []
-            for tool_dict in tools:
-                selection = MCPToolSelection(
-                    server=tool_dict["server"], functions=tool_dict.get("functions")
-                )
-                tool_selections.append(selection)
+        tool_selections = _parse_tool_selections(tools)
 
         return await chat_usecase.chat(
-            message, actual_model_key, actual_conversation_id, user_id, tool_selections
+            message,
+            actual_model_key,
+            actual_conversation_id,
+            user_id,
+            tool_selections,
+            on_delta=_progress_reporter(ctx),
         )
 
     @server.tool
@@ -159,12 +263,7 @@ def _register_mcp_tools(server: FastMCP):
         Returns:
             dict: 包含狀態的字典，由 MCPServerManagementUsecase.list_servers() 生成。
         """
-        logger.info("MCP tool called: list_mcp_servers")
-        mcp_manager_instance = get_mcp_manager()
-        agent_factory = get_agent_factory()
-        management_usecase = MCPServerManagementUsecase(
-            mcp_manager=mcp_manager_instance, agent_factory=agent_factory
-        )
+        logger.debug("MCP tool called: list_mcp_servers")
         # .model_dump() is used to convert the Pydantic model to a dict for the tool
         return management_usecase.list_servers().model_dump(by_alias=True)
 
@@ -187,12 +286,8 @@ def _register_mcp_tools(server: FastMCP):
             dict: 重新載入結果的字典，由 reload_server 生成。
         """
         logger.info("MCP tool called: reload_mcp_server (server=%s)", server_name)
-        mcp_manager_instance = get_mcp_manager()
-        agent_factory = get_agent_factory()
-        management_usecase = MCPServerManagementUsecase(
-            mcp_manager=mcp_manager_instance, agent_factory=agent_factory
-        )
         result = await management_usecase.reload_server(server_name)
+        clear_tool_cache()
         return result.model_dump(by_alias=True)
 
     @server.tool
@@ -210,12 +305,8 @@ def _register_mcp_tools(server: FastMCP):
             dict: 重新載入結果的字典，由 reload_all_servers 生成。
         """
         logger.info("MCP tool called: reload_all_mcp_servers")
-        mcp_manager_instance = get_mcp_manager()
-        agent_factory = get_agent_factory()
-        management_usecase = MCPServerManagementUsecase(
-            mcp_manager=mcp_manager_instance, agent_factory=agent_factory
-        )
         result = await management_usecase.reload_all_servers()
+        clear_tool_cache()
         return result.model_dump(by_alias=True)
 
     @server.tool
@@ -236,15 +327,17 @@ def _register_mcp_tools(server: FastMCP):
         Returns:
             list[str]: 函數名稱列表。
         """
-        logger.info(
+        logger.debug(
             "MCP tool called: get_mcp_server_functions (server=%s)", server_name
         )
-        mcp_manager_instance = get_mcp_manager()
-        agent_factory = get_agent_factory()
-        management_usecase = MCPServerManagementUsecase(
-            mcp_manager=mcp_manager_instance, agent_factory=agent_factory
+        # Only connected servers are cached, so arbitrary names sent by a
+        # peer cannot fill the cache
+        if server_name not in management_usecase.get_available_servers():
+            return management_usecase.get_server_functions(server_name)
+        return _cached_tool_result(
+            ("get_mcp_server_functions", server_name),
+            lambda: management_usecase.get_server_functions(server_name),
         )
-        return management_usecase.get_server_functions(server_name)
 
     @server.tool
     def get_available_mcp_servers(
@@ -260,13 +353,10 @@ def _register_mcp_tools(server: FastMCP):
         Returns:
             list[str]: 伺服器名稱列表。
         """
-        logger.info("MCP tool called: get_available_mcp_servers")
-        mcp_manager_instance = get_mcp_manager()
-        agent_factory = get_agent_factory()
-        management_usecase = MCPServerManagementUsecase(
-            mcp_manager=mcp_manager_instance, agent_factory=agent_factory
+        logger.debug("MCP tool called: get_available_mcp_servers")
+        return _cached_tool_result(
+            ("get_available_mcp_servers",), management_usecase.get_available_servers
         )
-        return management_usecase.get_available_servers()
 
     @server.tool
     def list_available_models(
@@ -282,13 +372,10 @@ def _register_mcp_tools(server: FastMCP):
         Returns:
             ListAvailableModelsResponse: 模型列表的 Pydantic 模型。
         """
-        logger.info("MCP tool 'list_available_models' called")
-        mcp_manager_instance = get_mcp_manager()
-        agent_factory = get_agent_factory()
-        management_usecase = MCPServerManagementUsecase(
-            mcp_manager=mcp_manager_instance, agent_factory=agent_factory
+        logger.debug("MCP tool 'list_available_models' called")
+        return _cached_tool_result(
+            ("list_available_models",), management_usecase.list_available_models
         )
-        return management_usecase.list_available_models()
 
     @server.tool
     def get_server_capabilities(
@@ -304,13 +391,10 @@ def _register_mcp_tools(server: FastMCP):
         Returns:
             GetServerCapabilitiesResponse: 能力資訊的 Pydantic 模型。
         """
-        logger.info("MCP tool 'get_server_capabilities' called")
-        mcp_manager_instance = get_mcp_manager()
-        agent_factory = get_agent_factory()
-        management_usecase = MCPServerManagementUsecase(
-            mcp_manager=mcp_manager_instance, agent_factory=agent_factory
+        logger.debug("MCP tool 'get_server_capabilities' called")
+        return _cached_tool_result(
+            ("get_server_capabilities",), management_usecase.get_server_capabilities
         )
-        return management_usecase.get_server_capabilities()
 
     @server.tool
     def get_app_config(
@@ -326,13 +410,10 @@ def _register_mcp_tools(server: FastMCP):
         Returns:
             AppConfigResponse: 配置資訊的 Pydantic 模型。
         """
-        logger.info("MCP tool 'get_app_config' called")
-        mcp_manager_instance = get_mcp_manager()
-        agent_factory = get_agent_factory()
-        management_usecase = MCPServerManagementUsecase(
-            mcp_manager=mcp_manager_instance, agent_factory=agent_factory
+        logger.debug("MCP tool 'get_app_config' called")
+        return _cached_tool_result(
+            ("get_app_config",), management_usecase.get_app_config
         )
-        return management_usecase.get_app_config()
 
     @server.tool
     def get_system_health(
@@ -348,10 +429,5 @@ def _register_mcp_tools(server: FastMCP):
         Returns:
             SystemHealthResponse: 健康狀態的 Pydantic 模型。
         """
-        logger.info("MCP tool 'get_system_health' called")
-        mcp_manager_instance = get_mcp_manager()
-        agent_factory = get_agent_factory()
-        management_usecase = MCPServerManagementUsecase(
-            mcp_manager=mcp_manager_instance, agent_factory=agent_factory
-        )
+        logger.debug("MCP tool 'get_system_health' called")
         return management_usecase.get_system_health()
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
 from src.core import get_logger
-from src.integrations.llm import PromptsConfigStore, ToolsConfigStore
+from src.integrations.llm import (
+    PromptsConfigStore,
+    ToolsConfigStore,
+    default_prompts_store,
+    default_tools_store,
+)
 from src.models.agno import (
     AgnoConfigResponse,
     PromptInfo,
@@ -15,22 +19,26 @@ from src.models.agno import (
     UpdatePromptRequest,
     UpdateToolkitRequest,
 )
-from src.shared.response import APIResponse, create_success_response
+from src.shared.response import (
+    APIResponse,
+    FastORJSONResponse,
+    create_success_response,
+)
 
-router = APIRouter(prefix="/agno", tags=["agno"])
+router = APIRouter(
+    prefix="/agno", tags=["agno"], default_response_class=FastORJSONResponse
+)
 logger = get_logger(__name__)
 
 
-@lru_cache(maxsize=1)
 def get_tools_store() -> ToolsConfigStore:
-    """Get or create the tools configuration store singleton."""
-    return ToolsConfigStore()
+    """Get the tools configuration store shared with the agent factory."""
+    return default_tools_store()
 
 
-@lru_cache(maxsize=1)
 def get_prompts_store() -> PromptsConfigStore:
-    """Get or create the prompts configuration store singleton."""
-    return PromptsConfigStore()
+    """Get the prompts configuration store shared with the agent factory."""
+    return default_prompts_store()
 
 
 ToolsStoreDep = Annotated[ToolsConfigStore, Depends(get_tools_store)]
@@ -41,18 +49,22 @@ PromptsStoreDep = Annotated[PromptsConfigStore, Depends(get_prompts_store)]
 async def get_agno_config(
     tools_store: ToolsStoreDep,
     prompts_store: PromptsStoreDep,
-) -> APIResponse[AgnoConfigResponse]:
+) -> FastORJSONResponse:
     """Get available Agno toolkits and prompts configuration.
 
     Returns current configuration of all toolkits and prompts,
-    including their enabled/disabled state.
+    including their enabled/disabled state. The payload is serialized to JSON
+    bytes once and returned directly, so FastAPI neither re-validates it
+    against ``response_model`` (kept for the OpenAPI schema only) nor walks
+    it with ``jsonable_encoder``.
     """
     logger.debug("Fetching Agno configuration")
 
+    # Store entries are already validated, so the view models skip validation
     # Get all toolkits
-    all_toolkits = tools_store._load_config().toolkits
+    all_toolkits = tools_store.config.toolkits
     toolkits = [
-        ToolkitInfo(
+        ToolkitInfo.model_construct(
             key=tk.key,
             toolkit_class=tk.toolkit_class,
             enabled=tk.enabled,
@@ -62,9 +74,9 @@ async def get_agno_config(
     ]
 
     # Get all prompts
-    all_prompts = prompts_store._load_config().prompts
+    all_prompts = prompts_store.config.prompts
     prompts = [
-        PromptInfo(
+        PromptInfo.model_construct(
             key=p.key,
             name=p.name,
             enabled=p.enabled,
@@ -81,10 +93,11 @@ async def get_agno_config(
         },
     )
 
-    return create_success_response(
-        data=AgnoConfigResponse(toolkits=toolkits, prompts=prompts),
+    response = create_success_response(
+        data=AgnoConfigResponse.model_construct(toolkits=toolkits, prompts=prompts),
         message="Agno configuration retrieved successfully",
     )
+    return FastORJSONResponse(response)
 
 
 @router.patch("/toolkits/{toolkit_key}", response_model=APIResponse[None])
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from collections.abc import AsyncIterator
 from functools import lru_cache
-from typing import Annotated
+from logging import ERROR, LoggerAdapter
+from typing import Annotated, cast
 
+import orjson
+import pydantic_core
 from fastapi import APIRouter, Depends, Response
+from src.api.mcp_server import clear_tool_cache
 from src.core import get_logger
 from src.integrations.llm import ConversationAgentFactory
 from src.models import (
@@ -19,27 +22,95 @@ from src.models import (
     UpsertLLMModelRequest,
 )
 from src.shared.exceptions.llm import LLMStreamError
-from src.shared.response import APIResponse, create_success_response
+from src.shared.response import (
+    APIResponse,
+    FastORJSONResponse,
+    create_success_response,
+)
 from src.usecases.conversation import ConversationUsecase, ModelManagementUsecase
 from starlette.responses import StreamingResponse
 
 
 @lru_cache(maxsize=1)
 def get_agent_factory() -> ConversationAgentFactory:
-    return ConversationAgentFactory()
+    return ConversationAgentFactory.default()
 
 
-router = APIRouter(prefix="/conversation", tags=["conversation"])
+router = APIRouter(
+    prefix="/conversation",
+    tags=["conversation"],
+    default_response_class=FastORJSONResponse,
+)
 logger = get_logger(__name__)
+# Stream failures are tagged once here instead of building ``extra`` per call.
+_stream_log = LoggerAdapter(logger, extra={"component": "sse"})
+
+# SSE stream tuning: idle time before a heartbeat comment, how many frames
+# the producer may run ahead of the client, and how long / how many bytes of
+# consecutive frames are merged into a single write.
+_HEARTBEAT_INTERVAL_SECONDS = 15.0
+_COALESCE_WINDOW_SECONDS = 0.01
+_COALESCE_MAX_BYTES = 8192
+_HEARTBEAT_FRAME = b": heartbeat\n\n"
+_ERROR_FRAME_PREFIX = b"event: error\ndata: "
+_STREAM_QUEUE_SIZE = 64
+_STREAM_END = object()
+# Shared across responses; Starlette copies these into each response's headers.
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # Disable Nginx buffering
+    "Connection": "keep-alive",
+}
+
+
+async def _coalesce_frames(
+    queue: asyncio.Queue[object], first: bytes
+) -> tuple[bytes, bool]:
+    """Merge frames arriving shortly after ``first`` into one payload.
+
+    Each frame keeps its own ``data: ...\\n\\n`` framing, so clients still parse
+    deltas one by one while a single send serves the whole batch. Returns the
+    merged payload and whether the end marker was reached.
+    """
+    batch = [first]
+    size = len(first)
+    try:
+        async with asyncio.timeout(_COALESCE_WINDOW_SECONDS):
+            while size < _COALESCE_MAX_BYTES:
+                frame = await queue.get()
+                if frame is _STREAM_END:
+                    return b"".join(batch), True
+                batch.append(cast(bytes, frame))
+                size += len(batch[-1])
+    except TimeoutError:
+        pass
+    return b"".join(batch), False
 
 
 AgentFactoryDep = Annotated[ConversationAgentFactory, Depends(get_agent_factory)]
 
 
+# The use cases are stateless, so one instance is reused per agent factory.
+# Caching sits behind the Depends providers so dependency overrides of
+# get_agent_factory still take effect.
+@lru_cache(maxsize=1)
+def _build_conversation_usecase(
+    agent_factory: ConversationAgentFactory,
+) -> ConversationUsecase:
+    return ConversationUsecase(agent_factory=agent_factory)
+
+
+@lru_cache(maxsize=1)
+def _build_model_management_usecase(
+    agent_factory: ConversationAgentFactory,
+) -> ModelManagementUsecase:
+    return ModelManagementUsecase(agent_factory)
+
+
 def get_conversation_usecase(
     agent_factory: AgentFactoryDep,
 ) -> ConversationUsecase:
-    return ConversationUsecase(agent_factory=agent_factory)
+    return _build_conversation_usecase(agent_factory)
 
 
 ConversationUsecaseDep = Annotated[
@@ -50,7 +121,7 @@ ConversationUsecaseDep = Annotated[
 def get_model_management_usecase(
     agent_factory: AgentFactoryDep,
 ) -> ModelManagementUsecase:
-    return ModelManagementUsecase(agent_factory)
+    return _build_model_management_usecase(agent_factory)
 
 
 ModelManagementUsecaseDep = Annotated[
@@ -72,103 +143,59 @@ async def stream_conversation_reply(
     payload: ConversationRequest,
     usecase: ConversationUsecaseDep,
 ) -> Response:
-    async def event_stream_with_heartbeat() -> AsyncIterator[str]:
+    async def produce_events(queue: asyncio.Queue[object]) -> None:
+        """Push SSE frames for the reply onto ``queue``, then the end marker."""
+        try:
+            async for chunk in usecase.stream_reply(payload):
+                data = pydantic_core.to_json(chunk, by_alias=True)
+                await queue.put(b"data: " + data + b"\n\n")
+        except LLMStreamError as exc:
+            error_payload = {
+                "type": exc.__class__.__name__,
+                "message": exc.detail,
+                "context": exc.context or None,
+            }
+            await queue.put(_ERROR_FRAME_PREFIX + orjson.dumps(error_payload) + b"\n\n")
+        except Exception as exc:  # pragma: no cover - defensive
+            if _stream_log.isEnabledFor(ERROR):
+                _stream_log.exception("Streaming conversation failed", exc_info=exc)
+            message = getattr(exc, "detail", str(exc)) or "Streaming error"
+            error_payload = {
+                "type": exc.__class__.__name__,
+                "message": message,
+                "context": getattr(exc, "context", None) or None,
+            }
+            await queue.put(_ERROR_FRAME_PREFIX + orjson.dumps(error_payload) + b"\n\n")
+        await queue.put(_STREAM_END)
+
+    async def event_stream_with_heartbeat() -> AsyncIterator[bytes]:
         """
         Stream events with heartbeat to prevent timeout during long operations.
         Sends SSE comment (': heartbeat') every 15 seconds if no data.
         """
-        heartbeat_interval = 15.0  # seconds
-        last_event_time = asyncio.get_event_loop().time()
-
-        async def heartbeat_sender():
-            """Send periodic heartbeat comments to keep connection alive."""
-            nonlocal last_event_time
-            while True:
-                await asyncio.sleep(heartbeat_interval)
-                current_time = asyncio.get_event_loop().time()
-                if current_time - last_event_time >= heartbeat_interval:
-                    yield ": heartbeat\n\n"
-
-        async def data_sender():
-            """Send actual streaming data and update last event time."""
-            nonlocal last_event_time
-            try:
-                async for chunk in usecase.stream_reply(payload):
-                    last_event_time = asyncio.get_event_loop().time()
-                    data = json.dumps(chunk.model_dump(by_alias=True))
-                    yield f"data: {data}\n\n"
-            except LLMStreamError as exc:
-                last_event_time = asyncio.get_event_loop().time()
-                error_payload = {
-                    "type": exc.__class__.__name__,
-                    "message": exc.detail,
-                    "context": exc.context or None,
-                }
-                yield f"event: error\ndata: {json.dumps(error_payload)}\n\n"
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.exception("Streaming conversation failed", exc_info=exc)
-                last_event_time = asyncio.get_event_loop().time()
-                message = getattr(exc, "detail", str(exc)) or "Streaming error"
-                error_payload = {
-                    "type": exc.__class__.__name__,
-                    "message": message,
-                    "context": getattr(exc, "context", None),
-                }
-                yield f"event: error\ndata: {json.dumps(error_payload)}\n\n"
-
-        # Merge heartbeat and data streams
-        heartbeat_gen = heartbeat_sender()
-        data_gen = data_sender()
-
-        # Use asyncio to interleave both generators
-        pending = {
-            asyncio.create_task(anext(heartbeat_gen)): "heartbeat",
-            asyncio.create_task(anext(data_gen)): "data",
-        }
-
+        queue: asyncio.Queue[object] = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+        producer = asyncio.create_task(produce_events(queue))
         try:
-            while pending:
-                done, pending_set = await asyncio.wait(
-                    pending.keys(), return_when=asyncio.FIRST_COMPLETED
-                )
-
-                # Process completed tasks BEFORE modifying pending dict
-                for task in done:
-                    source = pending[task]  # Get source before removing
-                    try:
-                        result = task.result()
-                        yield result
-
-                        # Create new task for the same source
-                        if source == "heartbeat":
-                            new_task = asyncio.create_task(anext(heartbeat_gen))
-                            pending[new_task] = "heartbeat"
-                        elif source == "data":
-                            new_task = asyncio.create_task(anext(data_gen))
-                            pending[new_task] = "data"
-                    except StopAsyncIteration:
-                        # One of the generators finished
-                        if source == "data":
-                            # Data stream finished, stop heartbeat too
-                            for remaining_task in pending_set:
-                                remaining_task.cancel()
-                            return
-                    finally:
-                        # Remove completed task from pending
-                        del pending[task]
+            while True:
+                try:
+                    async with asyncio.timeout(_HEARTBEAT_INTERVAL_SECONDS):
+                        frame = await queue.get()
+                except TimeoutError:
+                    yield _HEARTBEAT_FRAME
+                    continue
+                if frame is _STREAM_END:
+                    return
+                payload, finished = await _coalesce_frames(queue, cast(bytes, frame))
+                yield payload
+                if finished:
+                    return
         finally:
-            # Cleanup
-            for task in pending.keys():
-                task.cancel()
+            producer.cancel()
 
     return StreamingResponse(
         event_stream_with_heartbeat(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",  # Disable Nginx buffering
-            "Connection": "keep-alive",
-        },
+        headers=_SSE_HEADERS,
     )
 
 
@@ -186,6 +213,7 @@ async def update_active_model(
     usecase: ModelManagementUsecaseDep,
 ) -> Response:
     await usecase.set_active_model(model_key)
+    clear_tool_cache()
     return Response(status_code=204)
 
 
@@ -195,6 +223,7 @@ async def upsert_model(
     usecase: ModelManagementUsecaseDep,
 ) -> APIResponse[LLMModelDescriptor]:
     descriptor = await usecase.upsert_model(payload)
+    clear_tool_cache()
     return create_success_response(
         data=descriptor,
         message="Model configuration updated",
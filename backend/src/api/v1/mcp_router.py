@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
+from src.api.mcp_server import clear_tool_cache
 from src.core.logging import get_logger
 from src.integrations.llm import ConversationAgentFactory
 from src.integrations.mcp import manager as mcp_manager
@@ -13,28 +15,44 @@ from src.models.mcp import (
     ReloadAllMCPServersResponse,
     ReloadMCPServerResponse,
 )
-from src.shared.response import APIResponse, create_success_response
+from src.shared.response import (
+    APIResponse,
+    FastORJSONResponse,
+    create_success_response,
+)
 from src.usecases.mcp.mcp_usecase import MCPServerManagementUsecase
 
-router = APIRouter(prefix="/mcp", tags=["mcp"])
+router = APIRouter(
+    prefix="/mcp", tags=["mcp"], default_response_class=FastORJSONResponse
+)
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
 def get_mcp_manager() -> mcp_manager.MCPManager:
     return mcp_manager.MCPManager()
 
 
+@lru_cache(maxsize=1)
 def get_agent_factory() -> ConversationAgentFactory:
-    return ConversationAgentFactory()
+    return ConversationAgentFactory.default()
+
+
+# The use case is stateless, so one instance is reused per dependency pair;
+# caching behind the provider keeps dependency overrides working.
+@lru_cache(maxsize=1)
+def _build_server_management_usecase(
+    manager: mcp_manager.MCPManager,
+    agent_factory: ConversationAgentFactory,
+) -> MCPServerManagementUsecase:
+    return MCPServerManagementUsecase(mcp_manager=manager, agent_factory=agent_factory)
 
 
 def get_server_management_usecase(
     mcp_manager_dep: Annotated[mcp_manager.MCPManager, Depends(get_mcp_manager)],
     agent_factory_dep: Annotated[ConversationAgentFactory, Depends(get_agent_factory)],
 ) -> MCPServerManagementUsecase:
-    return MCPServerManagementUsecase(
-        mcp_manager=mcp_manager_dep, agent_factory=agent_factory_dep
-    )
+    return _build_server_management_usecase(mcp_manager_dep, agent_factory_dep)
 
 
 ServerManagementUsecaseDep = Annotated[
@@ -64,6 +82,7 @@ async def reload_all_servers(
     """Reload all enabled MCP servers."""
     logger.info("Received request to reload all MCP servers")
     payload = await usecase.reload_all_servers()
+    clear_tool_cache()
     return create_success_response(data=payload, message="All servers reloaded")
 
 
@@ -81,6 +100,7 @@ async def reload_server(
     # and the global exception handlers will convert them into the correct
     # HTTP error responses, as per the error handling documentation.
     payload = await usecase.reload_server(server_name)
+    clear_tool_cache()
     return create_success_response(
         data=payload,
         message=f"Server '{server_name}' reloaded successfully",
@@ -1,10 +1,36 @@
+import json
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Maps tuple-style "(a, b)" CORS lists onto JSON array brackets in one pass.
+_PARENS_TO_BRACKETS = str.maketrans("()", "[]")
+
+
+# Keyed by the working directory as well, so a chdir never serves a stale root.
+@lru_cache(maxsize=128)
+def _resolve_under_root(cwd: str, raw: str) -> Path:
+    path = Path(raw)
+    # 在測試環境中，允許使用臨時目錄
+    if str(path).startswith(("/tmp/", "/var/folders/")):
+        return path.resolve()
+
+    # 確保不會跳出專案根目錄，避免路徑注入風險
+    root = Path(cwd).resolve()
+    resolved = (root / path).resolve() if not path.is_absolute() else path.resolve()
+    if root not in resolved.parents and resolved != root:
+        raise ValueError("Configured path must reside within the project directory")
+    return resolved
+
+
+def _clean_cors_items(items: Any) -> list[str]:
+    """Stringify and strip CORS entries, dropping empty ones."""
+    return [item for item in (str(origin).strip() for origin in items) if item]
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -21,6 +47,14 @@ class Settings(BaseSettings):
         default=Path("config/active_llm_model.json"),
         alias="LLM_ACTIVE_MODEL_FILE",
     )
+    agno_prompts_file: Path = Field(
+        default=Path("config/agno_prompts.json"),
+        alias="AGNO_PROMPTS_FILE",
+    )
+    agno_tools_file: Path = Field(
+        default=Path("config/agno_tools.json"),
+        alias="AGNO_TOOLS_FILE",
+    )
     cors_allowed_origins: str | list[str] = Field(
         default="",
         alias="CORS_ALLOWED_ORIGINS",
@@ -38,7 +72,7 @@ class Settings(BaseSettings):
         alias="AS_A_MCP_SERVER",
     )
 
-    @property
+    @cached_property
     def cors_origins(self) -> list[str]:
         """
         Get CORS origins based on environment.
@@ -66,7 +100,7 @@ class Settings(BaseSettings):
                 "http://localhost:3000",  # Alternative dev port
             ]
 
-    @property
+    @cached_property
     def cors_methods(self) -> list[str]:
         """Get CORS methods (environment-independent)"""
         if self.cors_allowed_methods:
@@ -77,7 +111,7 @@ class Settings(BaseSettings):
             )
         return ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
 
-    @property
+    @cached_property
     def cors_headers(self) -> list[str]:
         """Get CORS headers (environment-independent)"""
         if self.cors_allowed_headers:
@@ -94,11 +128,11 @@ class Settings(BaseSettings):
             "X-Requested-With",
         ]
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         return self.environment == "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         return self.environment == "production"
 
@@ -109,20 +143,16 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-    @field_validator("llm_models_file", "llm_active_model_file", mode="before")
+    @field_validator(
+        "llm_models_file",
+        "llm_active_model_file",
+        "agno_prompts_file",
+        "agno_tools_file",
+        mode="before",
+    )
     @classmethod
     def _validate_path(cls, value: Any) -> Path:
-        path = Path(value)
-        # 在測試環境中，允許使用臨時目錄
-        if str(path).startswith(("/tmp/", "/var/folders/")):
-            return path.resolve()
-
-        # 確保不會跳出專案根目錄，避免路徑注入風險
-        root = Path.cwd().resolve()
-        resolved = (root / path).resolve() if not path.is_absolute() else path.resolve()
-        if root not in resolved.parents and resolved != root:
-            raise ValueError("Configured path must reside within the project directory")
-        return resolved
+        return _resolve_under_root(os.getcwd(), str(value))
 
     @field_validator(
         "cors_allowed_origins",
@@ -135,8 +165,6 @@ class Settings(BaseSettings):
         if value is None or value == "":
             return []
         if isinstance(value, str):
-            import json
-
             trimmed = value.strip()
 
             # Allow JSON-style arrays for convenience
@@ -144,21 +172,17 @@ class Settings(BaseSettings):
                 trimmed.startswith("(") and trimmed.endswith(")")
             ):
                 try:
-                    parsed = json.loads(trimmed.replace("(", "[").replace(")", "]"))
+                    parsed = json.loads(trimmed.translate(_PARENS_TO_BRACKETS))
                     if isinstance(parsed, (list, tuple)):
-                        return [
-                            str(origin).strip()
-                            for origin in parsed
-                            if str(origin).strip()
-                        ]
+                        return _clean_cors_items(parsed)
                 except json.JSONDecodeError as exc:
                     raise ValueError(
                         "CORS list JSON parsing failed",
                     ) from exc
 
-            return [origin.strip() for origin in trimmed.split(",") if origin.strip()]
+            return [origin for origin in map(str.strip, trimmed.split(",")) if origin]
         if isinstance(value, (list, tuple, set)):
-            return [str(origin).strip() for origin in value if str(origin).strip()]
+            return _clean_cors_items(value)
         raise TypeError(
             "CORS settings must be a comma-separated string or list of strings"
         )
@@ -23,7 +23,7 @@ from .logging import (
     get_logger,
     setup_logging,
 )
-from .middleware import MCPServerGuardMiddleware, TraceMiddleware
+from .middleware import MCPServerGuardMiddleware, TraceMiddleware, get_trace_id
 
 __all__ = [
     # Base exceptions
@@ -46,6 +46,7 @@ __all__ = [
     # Middleware
     "TraceMiddleware",
     "MCPServerGuardMiddleware",
+    "get_trace_id",
     # Logging
     "setup_logging",
     "get_logger",
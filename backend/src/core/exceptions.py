@@ -1,7 +1,13 @@
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from fastapi import HTTPException
 
+# Shared read-only stand-in for omitted mappings, so raising allocates no
+# empty dicts
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
 
 class BaseAppException(HTTPException):
     """
@@ -16,13 +22,22 @@ class BaseAppException(HTTPException):
         status_code: HTTP status code
         headers: Optional HTTP headers to include in response
         i18n_key: Internationalization key for error message
-        i18n_params: Parameters for i18n message interpolation
-        context: Additional context information for debugging
+        i18n_params: Parameters for i18n message interpolation (read-only)
+        context: Additional context information for debugging (read-only)
         retryable: Whether this error can be retried
         retry_after: Suggested retry delay in seconds
         max_retries: Maximum number of retry attempts
     """
 
+    # Fallback i18n key, derived once per class rather than on every raise
+    _default_i18n_key = "errors.baseappexception"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Subclasses may pin their own key in the class body
+        if "_default_i18n_key" not in cls.__dict__:
+            cls._default_i18n_key = f"errors.{cls.__name__.lower()}"
+
     def __init__(
         self,
         detail: str,
@@ -36,9 +51,13 @@ class BaseAppException(HTTPException):
         max_retries: int = 3,
     ):
         super().__init__(status_code=status_code, detail=detail, headers=headers)
-        self.i18n_key = i18n_key or f"errors.{self.__class__.__name__.lower()}"
-        self.i18n_params = i18n_params or {}
-        self.context = context or {}
+        self.i18n_key = i18n_key or self._default_i18n_key
+        self.i18n_params: Mapping[str, Any] = (
+            i18n_params if i18n_params is not None else _EMPTY_MAPPING
+        )
+        self.context: Mapping[str, Any] = (
+            context if context is not None else _EMPTY_MAPPING
+        )
         self.retryable = retryable
         self.retry_after = retry_after
         self.max_retries = max_retries
@@ -117,11 +136,19 @@ class UnprocessableEntityError(ClientError):
 class TooManyRequestsError(ClientError):
     """429 Too Many Requests"""
 
+    # Rate limit errors are typically retryable
+    _RETRY_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+        {
+            "retryable": True,
+            "retry_after": 60,
+            "max_retries": 5,
+        }
+    )
+
     def __init__(self, detail: str = "Too many requests", **kwargs):
-        # Rate limit errors are typically retryable
-        kwargs.setdefault("retryable", True)
-        kwargs.setdefault("retry_after", 60)  # Default 1 minute retry delay
-        kwargs.setdefault("max_retries", 5)
+        # Fill in omitted retry hints in place; no merged mapping is built
+        for key, value in self._RETRY_DEFAULTS.items():
+            kwargs.setdefault(key, value)
         super().__init__(detail=detail, status_code=429, **kwargs)
 
 
@@ -143,28 +170,44 @@ class BadGatewayError(ServerError):
 class ServiceUnavailableError(ServerError):
     """503 Service Unavailable"""
 
+    # Service unavailable errors are typically retryable
+    _RETRY_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+        {
+            "retryable": True,
+            "retry_after": 30,
+            "max_retries": 3,
+        }
+    )
+
     def __init__(self, detail: str = "Service temporarily unavailable", **kwargs):
-        # Service unavailable errors are typically retryable
-        kwargs.setdefault("retryable", True)
-        kwargs.setdefault("retry_after", 30)  # Default 30 seconds retry delay
-        kwargs.setdefault("max_retries", 3)
+        for key, value in self._RETRY_DEFAULTS.items():
+            kwargs.setdefault(key, value)
         super().__init__(detail=detail, status_code=503, **kwargs)
 
 
 class GatewayTimeoutError(ServerError):
     """504 Gateway Timeout"""
 
+    # Timeout errors are typically retryable
+    _RETRY_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+        {
+            "retryable": True,
+            "retry_after": 30,
+            "max_retries": 3,
+        }
+    )
+
     def __init__(self, detail: str = "Gateway timeout", **kwargs):
-        # Timeout errors are typically retryable
-        kwargs.setdefault("retryable", True)
-        kwargs.setdefault("retry_after", 30)  # Default 30 seconds retry delay
-        kwargs.setdefault("max_retries", 3)
+        for key, value in self._RETRY_DEFAULTS.items():
+            kwargs.setdefault(key, value)
         super().__init__(detail=detail, status_code=504, **kwargs)
 
 
 class TooManyToolsError(BadRequestError):
     """400 Bad Request - Too many tools"""
 
+    _default_i18n_key = "errors.tooManyTools"
+
     def __init__(
         self,
         detail: str = (
@@ -173,5 +216,4 @@ class TooManyToolsError(BadRequestError):
         ),
         **kwargs,
     ):
-        kwargs.setdefault("i18n_key", "errors.tooManyTools")
         super().__init__(detail=detail, **kwargs)
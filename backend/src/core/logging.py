@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import logging.handlers
 from logging.config import dictConfig
 from typing import Any
 
@@ -17,6 +20,27 @@ AUDIT_LOG_FORMAT = (
 )
 
 
+# Listener draining the console queue; replaced whenever logging is reconfigured.
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves traceback formatting to the listener thread.
+
+    The stock ``QueueHandler.prepare`` formats the whole record, tracebacks
+    included, in the logging thread. Only the message is merged here so the
+    record stays safe to hand off; ``exc_info`` travels with it and is
+    formatted by the listener's handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
 def _build_default_logging_config(log_level: str) -> dict[str, Any]:
     """Construct the default logging configuration dictionary."""
     return {
@@ -35,25 +59,31 @@ def _build_default_logging_config(log_level: str) -> dict[str, Any]:
                 "class": "logging.StreamHandler",
                 "formatter": "audit",
             },
+            # Callers only enqueue; console I/O happens on the listener thread.
+            "queue": {
+                "class": "src.core.logging.DeferredQueueHandler",
+                "handlers": ["console"],
+                "respect_handler_level": True,
+            },
         },
         "loggers": {
             "": {  # root logger
-                "handlers": ["console"],
+                "handlers": ["queue"],
                 "level": log_level,
                 "propagate": False,
             },
             "uvicorn": {
-                "handlers": ["console"],
+                "handlers": ["queue"],
                 "level": log_level,
                 "propagate": False,
             },
             "uvicorn.error": {
-                "handlers": ["console"],
+                "handlers": ["queue"],
                 "level": log_level,
                 "propagate": False,
             },
             "uvicorn.access": {
-                "handlers": ["console"],
+                "handlers": ["queue"],
                 "level": log_level,
                 "propagate": False,
             },
@@ -86,7 +116,34 @@ def setup_logging(
         for key, value in config_overrides.items():
             config[key] = value
 
+    _stop_queue_listener()
     dictConfig(config)
+    _start_queue_listener()
+
+
+def _start_queue_listener() -> None:
+    """Start the listener attached to the configured queue handler, if any."""
+    global _queue_listener
+
+    handler = logging.getHandlerByName("queue")
+    listener = getattr(handler, "listener", None)
+    if listener is None:
+        return
+
+    listener.start()
+    _queue_listener = listener
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the running queue listener, if any."""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def get_logger(name: str | None = None) -> logging.Logger:
@@ -1,44 +1,76 @@
+import os
 import time
-import uuid
-from collections.abc import Callable
+from contextvars import ContextVar
 
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+import orjson
+from fastapi.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.shared.exceptions.mcp import MCPServerNotAvailableError
 
+# Trace ID of the request being handled, readable from any code (including
+# tasks spawned by it) without passing the Request object around.
+_trace_id: ContextVar[str | None] = ContextVar("trace_id", default=None)
 
-class TraceMiddleware(BaseHTTPMiddleware):
+# Placeholder in pre-serialized error bodies that a known trace ID replaces.
+_NULL_TRACE_ID = b'"trace_id":null'
+
+
+def get_trace_id() -> str | None:
+    """Return the trace ID of the current request, if any."""
+    return _trace_id.get()
+
+
+class TraceMiddleware:
     """
     Trace middleware for request tracking and performance monitoring.
 
     Generates a unique trace ID for each request and adds it to both
     request state and response headers. Also tracks request processing time.
+
+    Implemented as plain ASGI middleware so requests are not routed through
+    the extra task and memory stream that ``BaseHTTPMiddleware`` adds.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Generate unique trace ID for this request
-        trace_id = str(uuid.uuid4())
-        request.state.trace_id = trace_id
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Generate unique trace ID for this request (128 random bits as hex,
+        # without building a UUID object); request.state reads scope["state"]
+        trace_id = os.urandom(16).hex()
+        scope.setdefault("state", {})["trace_id"] = trace_id
+        trace_header = (b"x-trace-id", trace_id.encode("latin-1"))
 
         # Record start time for performance monitoring
         start_time = time.perf_counter()
 
-        # Process the request
-        response = await call_next(request)
-
-        # Calculate processing time
-        process_time = time.perf_counter() - start_time
+        async def send_with_trace(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate processing time up to the response head
+                process_time = time.perf_counter() - start_time
 
-        # Add trace ID and processing time to response headers
-        response.headers["X-Trace-ID"] = trace_id
-        response.headers["X-Process-Time"] = f"{process_time:.6f}"
+                # Add trace ID and processing time as raw header pairs
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    trace_header,
+                    (b"x-process-time", b"%.6f" % process_time),
+                ]
+            await send(message)
 
-        return response
+        # Process the request
+        token = _trace_id.set(trace_id)
+        try:
+            await self.app(scope, receive, send_with_trace)
+        finally:
+            _trace_id.reset(token)
 
 
-class MCPServerGuardMiddleware(BaseHTTPMiddleware):
+class MCPServerGuardMiddleware:
     """
     Middleware to guard MCP server endpoints when AS_A_MCP_SERVER is disabled.
 
@@ -48,47 +80,64 @@ class MCPServerGuardMiddleware(BaseHTTPMiddleware):
     response following the application's error handling architecture.
     """
 
-    def __init__(self, app, as_a_mcp_server: bool, enable_mcp_system: bool):
-        super().__init__(app)
+    def __init__(
+        self, app: ASGIApp, as_a_mcp_server: bool, enable_mcp_system: bool
+    ) -> None:
+        self.app = app
         self.as_a_mcp_server = as_a_mcp_server
         self.enable_mcp_system = enable_mcp_system
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Check if this is a request to the MCP endpoint
-        if request.url.path.startswith("/mcp"):
-            # If MCP server is disabled, raise exception for proper error handling
-            if not self.as_a_mcp_server:
-                # Create the exception
-                exc = MCPServerNotAvailableError(
-                    as_a_mcp_server=self.as_a_mcp_server,
-                    enable_mcp_system=self.enable_mcp_system,
+        # The flags are fixed for the process lifetime, so the error response
+        # is serialized once; only a trace_id is spliced in per request
+        exc = MCPServerNotAvailableError(
+            as_a_mcp_server=as_a_mcp_server,
+            enable_mcp_system=enable_mcp_system,
+        )
+        response_content = {
+            "success": False,
+            "error": {
+                "type": exc.__class__.__name__,
+                "message": exc.get_i18n_message(),
+                "trace_id": None,
+                "context": exc.context if exc.context else None,
+            },
+            "retry_info": {
+                "retryable": exc.retryable,
+                "retry_after": exc.retry_after,
+                "max_retries": exc.max_retries,
+                "current_attempt": 1,
+            },
+        }
+        self._status_code = exc.status_code
+        self._headers = exc.headers or {}
+        self._body = orjson.dumps(response_content)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Nothing to guard when acting as an MCP server
+        if self.as_a_mcp_server or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Check if this is a request to the MCP endpoint (the mount itself or
+        # anything below it, compared on the raw scope path)
+        path: str = scope["path"]
+        if path == "/mcp" or path.startswith("/mcp/"):
+            # Get trace_id from request state
+            trace_id = scope.get("state", {}).get("trace_id")
+            body = self._body
+            if trace_id is not None:
+                body = body.replace(
+                    _NULL_TRACE_ID, b'"trace_id":' + orjson.dumps(trace_id), 1
                 )
 
-                # Get trace_id from request state
-                trace_id = getattr(request.state, "trace_id", None)
-
-                # Build response following the error handling architecture
-                response_content = {
-                    "success": False,
-                    "error": {
-                        "type": exc.__class__.__name__,
-                        "message": exc.get_i18n_message(),
-                        "trace_id": trace_id,
-                        "context": exc.context if exc.context else None,
-                    },
-                    "retry_info": {
-                        "retryable": exc.retryable,
-                        "retry_after": exc.retry_after,
-                        "max_retries": exc.max_retries,
-                        "current_attempt": 1,
-                    },
-                }
-
-                return JSONResponse(
-                    status_code=exc.status_code,
-                    content=response_content,
-                    headers=exc.headers or {},
-                )
+            response = Response(
+                content=body,
+                status_code=self._status_code,
+                headers=self._headers,
+                media_type="application/json",
+            )
+            await response(scope, receive, send)
+            return
 
         # Continue with normal request processing
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -3,9 +3,9 @@
 from .config_store import ModelConfigStore
 from .factory import ConversationAgentFactory
 from .model_config import LLMModelConfig
-from .prompts_store import PromptsConfigStore
+from .prompts_store import PromptsConfigStore, default_prompts_store
 from .providers import ProviderFactory, build_model
-from .tools_store import ToolsConfigStore
+from .tools_store import ToolsConfigStore, default_tools_store
 
 __all__ = [
     "ConversationAgentFactory",
@@ -15,4 +15,6 @@ __all__ = [
     "PromptsConfigStore",
     "ToolsConfigStore",
     "build_model",
+    "default_prompts_store",
+    "default_tools_store",
 ]
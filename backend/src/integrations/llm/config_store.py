@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from threading import Lock
 
@@ -43,38 +45,56 @@ _DEFAULT_MODEL_CONFIGS: tuple[LLMModelConfig, ...] = (
 _DEFAULT_ACTIVE_KEY: str = _DEFAULT_MODEL_CONFIGS[0].key
 
 
-class ModelConfigStore:
-    """Loads and persists model configuration without hardcoding providers."""
+@dataclass(frozen=True, slots=True)
+class _ModelsCache:
+    """Parsed models file together with the file stamp it was read at."""
+
+    stamp: tuple[int, int]
+    configs: tuple[LLMModelConfig, ...]
+    by_key: dict[str, LLMModelConfig]
 
-    _instance: ModelConfigStore | None = None
-    _class_initialized = False
 
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+def _file_stamp(path: Path) -> tuple[int, int]:
+    """Identify a file revision by modification time and size."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ModelConfigStore:
+    """Loads and persists model configuration without hardcoding providers."""
 
     def __init__(
         self,
         models_path: Path | None = None,
         active_path: Path | None = None,
     ) -> None:
-        if ModelConfigStore._class_initialized:
-            return
-
         self._models_path = models_path or settings.llm_models_file
         self._active_path = active_path or settings.llm_active_model_file
         self._lock = Lock()
+        # Parsed file contents keyed by the file stamp they were read at, so
+        # edits made outside this process are still picked up
+        self._models_cache: _ModelsCache | None = None
+        self._active_cache: tuple[tuple[int, int], str] | None = None
         self._ensure_files()
-        ModelConfigStore._class_initialized = True
+
+    @classmethod
+    @cache
+    def default(cls) -> ModelConfigStore:
+        """Return the process-wide store for the configured model files."""
+        return cls()
 
     def list_configs(self) -> list[LLMModelConfig]:
-        return [config.model_copy(deep=True) for config in self._read_models_file()]
+        """Return all model configurations.
+
+        The instances are shared with the in-memory cache; treat them as
+        read-only and go through ``upsert_config`` to change them.
+        """
+        return list(self._load_models().configs)
 
     def get_config(self, key: str) -> LLMModelConfig:
-        for config in self.list_configs():
-            if config.key == key:
-                return config
+        config = self._load_models().by_key.get(key)
+        if config is not None:
+            return config
         msg = f"Model configuration '{key}' not found"
         raise NotFoundError(
             detail=msg,
@@ -87,7 +107,17 @@ class ModelConfigStore:
             if not self._active_path.exists():
                 self._write_active_key(_DEFAULT_ACTIVE_KEY)
                 return _DEFAULT_ACTIVE_KEY
+            stamp = _file_stamp(self._active_path)
+            cached = self._active_cache
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
             raw = self._active_path.read_text(encoding="utf-8").strip()
+        key = self._parse_active_key(raw)
+        self._active_cache = (stamp, key)
+        return key
+
+    @staticmethod
+    def _parse_active_key(raw: str) -> str:
         if not raw:
             return _DEFAULT_ACTIVE_KEY
         try:
@@ -110,14 +140,18 @@ class ModelConfigStore:
         self._write_configs(configs)
 
     def upsert_config(self, config: LLMModelConfig) -> None:
-        existing = {item.key: item for item in self.list_configs()}
+        existing = {item.key: item for item in self._load_models().configs}
         existing[config.key] = config
         self._write_configs(existing.values())
 
-    def _read_models_file(self) -> list[LLMModelConfig]:
+    def _load_models(self) -> _ModelsCache:
         with self._lock:
             if not self._models_path.exists():
                 self._write_default_models()
+            stamp = _file_stamp(self._models_path)
+            cached = self._models_cache
+            if cached is not None and cached.stamp == stamp:
+                return cached
             raw = self._models_path.read_text(encoding="utf-8")
         if raw.strip() == "":
             raise ValueError("Model configuration file cannot be empty")
@@ -125,7 +159,13 @@ class ModelConfigStore:
             registry = LLMModelRegistryFile.model_validate_json(raw)
         except ValidationError as exc:
             raise ValueError("Invalid model configuration file format") from exc
-        return [model.model_copy(deep=True) for model in registry.models]
+        by_key: dict[str, LLMModelConfig] = {}
+        for model in registry.models:
+            # First entry wins for a repeated key, matching a linear search
+            by_key.setdefault(model.key, model)
+        loaded = _ModelsCache(stamp, tuple(registry.models), by_key)
+        self._models_cache = loaded
+        return loaded
 
     def _ensure_files(self) -> None:
         with self._lock:
@@ -141,21 +181,24 @@ class ModelConfigStore:
         )
         serialized = registry.model_dump_json(indent=2)
         self._models_path.write_text(serialized, encoding="utf-8")
+        self._models_cache = None
 
     def _write_active_key(self, key: str) -> None:
         self._active_path.parent.mkdir(parents=True, exist_ok=True)
         payload = json.dumps({"active_model_key": key}, indent=2)
         self._active_path.write_text(payload, encoding="utf-8")
+        self._active_cache = None
 
     def _write_active_key_with_lock(self, key: str) -> None:
         with self._lock:
             self._write_active_key(key)
 
     def _write_configs(self, configs: Iterable[LLMModelConfig]) -> None:
-        payload = LLMModelRegistryFile(
-            models=[cfg.model_copy(deep=True) for cfg in configs]
-        )
+        # The configs are validated instances and serialization only reads
+        # them, so they are neither re-validated nor copied
+        payload = LLMModelRegistryFile.model_construct(models=list(configs))
         with self._lock:
             self._models_path.parent.mkdir(parents=True, exist_ok=True)
             serialized = payload.model_dump_json(indent=2)
             self._models_path.write_text(serialized, encoding="utf-8")
+            self._models_cache = None
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import cache
+from logging import INFO
+from types import MappingProxyType
 from typing import Any
 
 from agno.agent import Agent
@@ -10,37 +14,37 @@ from src.core import get_logger
 
 from .config_store import ModelConfigStore
 from .model_config import LLMModelConfig
-from .prompts_store import PromptsConfigStore
+from .prompts_store import PromptsConfigStore, default_prompts_store
 from .providers import build_model
-from .tools_store import ToolsConfigStore
+from .tools_store import ToolsConfigStore, default_tools_store
 
 logger = get_logger(__name__)
 
+_NO_OVERRIDES: MappingProxyType[str, Any] = MappingProxyType({})
+
 
 class ConversationAgentFactory:
     """Creates Agno agents using runtime model configuration."""
 
-    _instance: ConversationAgentFactory | None = None
-    _class_initialized = False
-
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
     def __init__(
         self,
         store: ModelConfigStore | None = None,
         tools_store: ToolsConfigStore | None = None,
         prompts_store: PromptsConfigStore | None = None,
     ) -> None:
-        if ConversationAgentFactory._class_initialized:
-            return
-
-        self._store = store or ModelConfigStore()
-        self._tools_store = tools_store or ToolsConfigStore()
-        self._prompts_store = prompts_store or PromptsConfigStore()
-        ConversationAgentFactory._class_initialized = True
+        self._store = store or ModelConfigStore.default()
+        self._tools_store = tools_store or default_tools_store()
+        self._prompts_store = prompts_store or default_prompts_store()
+        # Built provider models keyed by (model key, overrides). Each entry
+        # remembers the config it was built from so a reloaded config
+        # (external file edit) is rebuilt rather than served stale.
+        self._models: dict[tuple[str, frozenset[Any]], tuple[LLMModelConfig, Any]] = {}
+
+    @classmethod
+    @cache
+    def default(cls) -> ConversationAgentFactory:
+        """Return the process-wide factory built on the default stores."""
+        return cls()
 
     def create_agent(
         self,
@@ -72,16 +76,18 @@ class ConversationAgentFactory:
         # Load model
         key = model_key or self._store.get_active_model_key()
         config = self._store.get_config(key)
-        model = build_model(config, overrides or {})
-
-        logger.info(
-            "Creating agent",
-            extra={
-                "model_key": key,
-                "prompt_key": prompt_key or "default",
-                "session_id": session_id,
-            },
-        )
+        model = self._get_model(config, overrides or _NO_OVERRIDES)
+        log_info = logger.isEnabledFor(INFO)
+
+        if log_info:
+            logger.info(
+                "Creating agent",
+                extra={
+                    "model_key": key,
+                    "prompt_key": prompt_key or "default",
+                    "session_id": session_id,
+                },
+            )
 
         # Load tools
         tools = self._tools_store.load_toolkit_instances(strict=strict_tools)
@@ -90,8 +96,7 @@ class ConversationAgentFactory:
         instructions = self._prompts_store.get_instructions(prompt_key or "default")
         system_message = self._prompts_store.get_system_message()
 
-        # Get metadata
-        metadata = config.metadata or {}
+        debug_mode = bool(config.metadata and config.metadata.get("debug", False))
 
         # Build agent
         agent = Agent(
@@ -99,21 +104,49 @@ class ConversationAgentFactory:
             tools=tools if tools else None,
             instructions=instructions if instructions else None,
             description=system_message,
-            debug_mode=bool(metadata.get("debug", False)),
+            debug_mode=debug_mode,
         )
 
-        logger.info(
-            "✓ Agent created successfully",
-            extra={
-                "model_key": key,
-                "tool_count": len(tools),
-                "instruction_count": len(instructions),
-                "debug_mode": bool(metadata.get("debug", False)),
-            },
-        )
+        if log_info:
+            logger.info(
+                "✓ Agent created successfully",
+                extra={
+                    "model_key": key,
+                    "tool_count": len(tools),
+                    "instruction_count": len(instructions),
+                    "debug_mode": debug_mode,
+                },
+            )
 
         return agent
 
+    def _get_model(self, config: LLMModelConfig, overrides: Mapping[str, Any]) -> Any:
+        """Return a provider model for ``config``, reusing a previous build."""
+        try:
+            cache_key = (config.key, frozenset(overrides.items()))
+        except TypeError:
+            # Unhashable override values cannot be cached; build directly.
+            return build_model(config, overrides)
+
+        cached = self._models.get(cache_key)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+
+        model = build_model(config, overrides)
+        self._models[cache_key] = (config, model)
+        return model
+
+    def preload(self) -> None:
+        """Read every backing config file so later lookups hit warm caches.
+
+        Called at application startup; cold reads are blocking file I/O and
+        would otherwise happen on the event loop during the first request.
+        """
+        self._store.list_configs()
+        self._store.get_active_model_key()
+        _ = self._tools_store.config
+        _ = self._prompts_store.config
+
     def get_available_models(self) -> list[LLMModelConfig]:
         return self._store.list_configs()
 
@@ -122,9 +155,11 @@ class ConversationAgentFactory:
 
     def set_active_model_key(self, key: str) -> None:
         self._store.set_active_model_key(key)
+        self._models.clear()
 
     def register_model(self, config: LLMModelConfig) -> None:
         self._store.upsert_config(config)
+        self._models.clear()
 
     def get_available_prompts(self) -> list[dict[str, str | bool]]:
         """Get list of available prompt presets."""
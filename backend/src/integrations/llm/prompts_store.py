@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
+from src.config import settings
 from src.core import get_logger
 from src.shared.exceptions.agno import PromptNotFoundError
 
@@ -21,22 +23,22 @@ class PromptsConfigStore:
 
         Args:
             config_path: Path to agno_prompts.json.
-                If None, uses default config directory.
+                If None, uses ``settings.agno_prompts_file``.
         """
-        if config_path is None:
-            # Try to find config relative to project root
-            cwd = Path.cwd()
-            # Check if we're in backend directory
-            if cwd.name == "backend":
-                default_path = cwd / "config" / "agno_prompts.json"
-            else:
-                # We're in project root
-                default_path = cwd / "backend" / "config" / "agno_prompts.json"
-        else:
-            default_path = config_path
-
-        self._config_path = default_path
+        self._config_path = config_path or settings.agno_prompts_file
         self._config: AgnoPromptsConfig | None = None
+        # Prompt lookup by key, built once per load; entries are the same
+        # objects as in ``_config`` so in-place updates stay visible
+        self._by_key: dict[str, PromptConfig] = {}
+
+    @property
+    def config(self) -> AgnoPromptsConfig:
+        """The parsed prompts configuration.
+
+        Loaded from disk on first access and cached on the store; the update
+        methods edit this cached object in place before persisting it.
+        """
+        return self._load_config()
 
     def _load_config(self) -> AgnoPromptsConfig:
         """Load prompts configuration from JSON file."""
@@ -49,19 +51,22 @@ class PromptsConfigStore:
                     / "default_agno_prompts.json"
                 )
                 if default_path.exists():
-                    with default_path.open("r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        self._config = AgnoPromptsConfig.model_validate(data)
+                    raw = default_path.read_bytes()
+                    self._config = AgnoPromptsConfig.model_validate_json(raw)
                     # Copy default to config location
                     self._config_path.parent.mkdir(parents=True, exist_ok=True)
-                    with self._config_path.open("w", encoding="utf-8") as f:
-                        json.dump(data, f, indent=2)
+                    self._config_path.write_bytes(raw)
                 else:
                     self._config = AgnoPromptsConfig()
             else:
-                with self._config_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._config = AgnoPromptsConfig.model_validate(data)
+                # Parse and validate in one pass, without an intermediate dict
+                self._config = AgnoPromptsConfig.model_validate_json(
+                    self._config_path.read_bytes()
+                )
+            self._by_key = {}
+            for prompt in self._config.prompts:
+                # First entry wins for a repeated key, matching a linear search
+                self._by_key.setdefault(prompt.key, prompt)
         return self._config
 
     def get_enabled_prompts(self) -> list[PromptConfig]:
@@ -81,12 +86,11 @@ class PromptsConfigStore:
         Raises:
             PromptNotFoundError: If the prompt configuration is not found.
         """
-        config = self._load_config()
-        for prompt in config.prompts:
-            if prompt.key == key:
-                return prompt
-
-        raise PromptNotFoundError(prompt_key=key)
+        self._load_config()
+        prompt = self._by_key.get(key)
+        if prompt is None:
+            raise PromptNotFoundError(prompt_key=key)
+        return prompt
 
     def get_instructions(self, key: str = "default") -> list[str]:
         """Get instructions list for a specific prompt preset.
@@ -146,17 +150,18 @@ class PromptsConfigStore:
             PromptNotFoundError: If the prompt key is not found
         """
         config = self._load_config()
-        prompt_found = False
-
-        for prompt in config.prompts:
-            if prompt.key == key:
-                prompt.enabled = enabled
-                prompt_found = True
-                break
-
-        if not prompt_found:
-            raise PromptNotFoundError(prompt_key=key)
+        self.get_prompt_by_key(key).enabled = enabled
 
         # Save updated config
         with self._config_path.open("w", encoding="utf-8") as f:
             json.dump(config.model_dump(), f, indent=2)
+
+
+@lru_cache(maxsize=1)
+def default_prompts_store() -> PromptsConfigStore:
+    """Return the process-wide store for the default prompts config path.
+
+    Sharing one instance means the file is parsed once, and enabled-state
+    updates made through the API are seen by agent creation.
+    """
+    return PromptsConfigStore()
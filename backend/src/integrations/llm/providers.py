@@ -3,11 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
-from typing import Any
-
-from agno.models.google import Gemini
-from agno.models.ollama import Ollama
-from agno.models.openai import OpenAIChat
+from typing import TYPE_CHECKING, Any
 
 from src.config import settings
 from src.shared.exceptions import (
@@ -17,6 +13,11 @@ from src.shared.exceptions import (
 
 from .model_config import LLMModelConfig
 
+if TYPE_CHECKING:
+    from agno.models.google import Gemini
+    from agno.models.ollama import Ollama
+    from agno.models.openai import OpenAIChat
+
 ProviderFactory = Callable[[LLMModelConfig, Mapping[str, Any]], Any]
 
 
@@ -39,6 +40,10 @@ def _build_openai_model(
         params["base_url"] = config.base_url
     params.update(config.default_params)
     params.update(overrides)
+
+    # Vendor SDKs are imported on first use so only configured providers load
+    from agno.models.openai import OpenAIChat
+
     return OpenAIChat(**params)
 
 
@@ -57,6 +62,8 @@ def _build_google_model(
     # gemini-2.0-flash is the only one verified to work in Agno without 404
     model_id = "gemini-2.0-flash"
     
+    from agno.models.google import Gemini
+
     return Gemini(id=model_id, api_key=api_key)
 
 
@@ -76,6 +83,8 @@ def _build_ollama_model(
     if ollama_options:
         params["options"] = ollama_options
 
+    from agno.models.ollama import Ollama
+
     return Ollama(**params)
 
 
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import importlib
-import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+from src.config import settings
 from src.core import get_logger
 from src.shared.exceptions.agno import ToolkitLoadError, ToolkitNotFoundError
 
@@ -14,6 +18,29 @@ from .tools_config import AgnoToolsConfig, ToolkitConfig
 
 logger = get_logger(__name__)
 
+_DEFAULT_TOOLS_PATH = (
+    Path(__file__).parent.parent.parent.parent / "defaults" / "default_agno_tools.json"
+)
+
+# Resolved toolkit classes keyed by dotted class path. Failed lookups are
+# never stored, so a toolkit whose module becomes importable is retried.
+_TOOLKIT_CLASSES: dict[str, type] = {}
+
+
+def _cached_toolkit_class(class_path: str) -> type:
+    """Resolve a dotted class path such as ``agno.tools.x.XTools``.
+
+    Raises:
+        ImportError: If the module cannot be imported.
+        AttributeError: If the module has no such class.
+    """
+    toolkit_class = _TOOLKIT_CLASSES.get(class_path)
+    if toolkit_class is None:
+        module_path, class_name = class_path.rsplit(".", 1)
+        module = importlib.import_module(module_path)
+        toolkit_class = _TOOLKIT_CLASSES[class_path] = getattr(module, class_name)
+    return toolkit_class
+
 
 class ToolsConfigStore:
     """Manages loading and instantiation of Agno tools from configuration."""
@@ -23,53 +50,50 @@ class ToolsConfigStore:
 
         Args:
             config_path: Path to agno_tools.json.
-                If None, uses default config directory.
+                If None, uses ``settings.agno_tools_file``.
         """
-        if config_path is None:
-            # Try to find config relative to project root
-            cwd = Path.cwd()
-            # Check if we're in backend directory
-            if cwd.name == "backend":
-                default_path = cwd / "config" / "agno_tools.json"
-            else:
-                # We're in project root
-                default_path = cwd / "backend" / "config" / "agno_tools.json"
-        else:
-            default_path = config_path
-
-        self._config_path = default_path
+        self._config_path = config_path or settings.agno_tools_file
         self._config: AgnoToolsConfig | None = None
+        self._enabled_toolkits: tuple[ToolkitConfig, ...] = ()
+
+    @property
+    def config(self) -> AgnoToolsConfig:
+        """The parsed tools configuration.
+
+        Loaded from disk on first access and cached on the store; the update
+        methods edit this cached object in place before persisting it.
+        """
+        return self._load_config()
 
     def _load_config(self) -> AgnoToolsConfig:
         """Load tools configuration from JSON file."""
         if self._config is None:
-            if not self._config_path.exists():
+            try:
+                raw = self._config_path.read_bytes()
+            except FileNotFoundError:
                 # Load default configuration
-                default_path = (
-                    Path(__file__).parent.parent.parent.parent
-                    / "defaults"
-                    / "default_agno_tools.json"
-                )
-                if default_path.exists():
-                    with default_path.open("r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        self._config = AgnoToolsConfig.model_validate(data)
+                try:
+                    raw = _DEFAULT_TOOLS_PATH.read_bytes()
+                except FileNotFoundError:
+                    self._config = AgnoToolsConfig()
+                else:
+                    self._config = AgnoToolsConfig.model_validate_json(raw)
                     # Copy default to config location
                     self._config_path.parent.mkdir(parents=True, exist_ok=True)
-                    with self._config_path.open("w", encoding="utf-8") as f:
-                        json.dump(data, f, indent=2)
-                else:
-                    self._config = AgnoToolsConfig()
+                    self._config_path.write_bytes(raw)
             else:
-                with self._config_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._config = AgnoToolsConfig.model_validate(data)
+                # Parse and validate in one pass, without an intermediate dict
+                self._config = AgnoToolsConfig.model_validate_json(raw)
+            self._refresh_enabled_toolkits(self._config)
         return self._config
 
-    def get_enabled_toolkits(self) -> list[ToolkitConfig]:
-        """Get list of enabled toolkit configurations."""
-        config = self._load_config()
-        return [tk for tk in config.toolkits if tk.enabled]
+    def _refresh_enabled_toolkits(self, config: AgnoToolsConfig) -> None:
+        self._enabled_toolkits = tuple(tk for tk in config.toolkits if tk.enabled)
+
+    def get_enabled_toolkits(self) -> tuple[ToolkitConfig, ...]:
+        """Get the enabled toolkit configurations, filtered once per change."""
+        self._load_config()
+        return self._enabled_toolkits
 
     def load_toolkit_instances(self, *, strict: bool = False) -> list[Any]:
         """Dynamically load and instantiate enabled toolkits.
@@ -97,15 +121,9 @@ class ToolsConfigStore:
                     },
                 )
 
-                # Parse the toolkit class path
+                # Resolve the toolkit class path
                 # e.g., "agno.tools.duckduckgo.DuckDuckGoTools"
-                module_path, class_name = tk_config.toolkit_class.rsplit(".", 1)
-
-                # Dynamically import the module
-                module = importlib.import_module(module_path)
-
-                # Get the class from the module
-                toolkit_class = getattr(module, class_name)
+                toolkit_class = _cached_toolkit_class(tk_config.toolkit_class)
 
                 # Instantiate with config parameters
                 instance = toolkit_class(**tk_config.config)
@@ -224,18 +242,29 @@ class ToolsConfigStore:
         Raises:
             ToolkitNotFoundError: If the toolkit key is not found
         """
-        config = self._load_config()
-        toolkit_found = False
+        toolkit = self.get_toolkit_config(key)
+        if toolkit.enabled == enabled:
+            return
 
-        for tk in config.toolkits:
-            if tk.key == key:
-                tk.enabled = enabled
-                toolkit_found = True
-                break
-
-        if not toolkit_found:
-            raise ToolkitNotFoundError(toolkit_key=key)
-
-        # Save updated config
-        with self._config_path.open("w", encoding="utf-8") as f:
-            json.dump(config.model_dump(), f, indent=2)
+        toolkit.enabled = enabled
+        config = self._load_config()
+        self._refresh_enabled_toolkits(config)
+
+        # Save updated config; write a sibling file and swap it in so a
+        # crash mid-write never leaves a truncated config behind
+        payload = orjson.dumps(
+            config.model_dump(mode="json"), option=orjson.OPT_INDENT_2
+        )
+        tmp_path = self._config_path.with_name(f"{self._config_path.name}.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self._config_path)
+
+
+@lru_cache(maxsize=1)
+def default_tools_store() -> ToolsConfigStore:
+    """Return the process-wide store for the default tools config path.
+
+    Toolkit toggles made through the API update this instance, so agent
+    creation sees them without re-reading the file.
+    """
+    return ToolsConfigStore()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from pydantic import Field, field_validator
@@ -30,12 +31,9 @@ class MCPSettings(BaseSettings):
     def _normalise_config_path(cls, value: str | Path | None) -> Path | None:
         if value is None:
             return None
-        path = Path(value).expanduser()
-        if not path.is_absolute():
-            path = (Path.cwd() / path).resolve()
-        else:
-            path = path.resolve()
-        return path
+        # Lexical normalisation only: the file is just opened later, so there
+        # is no need to stat every path component at import time
+        return Path(os.path.abspath(Path(value).expanduser()))
 
     def is_mcp_enabled_globally(self) -> bool:
         """Return True when the MCP system is enabled."""
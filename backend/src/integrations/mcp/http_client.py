@@ -25,6 +25,66 @@ _HTTP_CLIENT_TERMINATE_ON_CLOSE = (
     False  # Manual lifecycle management for persistent connections
 )
 _HTTP_CLIENT_DEFAULT_TIMEOUT = 60  # Default timeout in seconds
+# Upper bound for establishing a connection or waiting for a pooled one, so
+# an unreachable host fails fast instead of using the whole request budget
+_HTTP_CLIENT_CONNECT_TIMEOUT = 10.0
+
+# Hints for SDK errors that only carry an HTTP status in their message, as
+# (needles, hint) in priority order; the first entry with a match wins.
+_STATUS_CODE_HINTS: tuple[tuple[tuple[str, ...], str], ...] = (
+    (
+        ("502", "Bad Gateway"),
+        " (Possible HTTP 502 Bad Gateway - target server unavailable)",
+    ),
+    (
+        ("401", "Unauthorized"),
+        " (Possible HTTP 401 Unauthorized - check authentication)",
+    ),
+    (("403", "Forbidden"), " (Possible HTTP 403 Forbidden - check permissions)"),
+    (("404", "Not Found"), " (Possible HTTP 404 Not Found - check URL)"),
+)
+_TIMEOUT_HINT = " (Connection timeout - server not responding)"
+
+
+def _status_code_hint(error_msg: str) -> str:
+    """Return a human hint for a status code mentioned in ``error_msg``."""
+    for needles, hint in _STATUS_CODE_HINTS:
+        if any(needle in error_msg for needle in needles):
+            return hint
+    if "timeout" in error_msg.lower():
+        return _TIMEOUT_HINT
+    return ""
+
+
+def _create_http_client(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+) -> httpx.AsyncClient:
+    """Build the HTTP client for ``streamablehttp_client``.
+
+    Mirrors the SDK's default client (redirects followed), except that the
+    connect and pool waits are capped instead of sharing the read budget.
+    """
+    timeout = timeout or httpx.Timeout(_HTTP_CLIENT_DEFAULT_TIMEOUT)
+    split_timeout = httpx.Timeout(
+        connect=_cap_wait(timeout.connect),
+        read=timeout.read,
+        write=timeout.write,
+        pool=_cap_wait(timeout.pool),
+    )
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=split_timeout,
+        auth=auth,
+        follow_redirects=True,
+    )
+
+
+def _cap_wait(seconds: float | None) -> float:
+    if seconds is None:
+        return _HTTP_CLIENT_CONNECT_TIMEOUT
+    return min(seconds, _HTTP_CLIENT_CONNECT_TIMEOUT)
 
 
 async def create_http_mcp_connection(
@@ -77,10 +137,10 @@ async def create_http_mcp_connection(
     )
 
     # Build headers for authentication
-    headers: dict[str, str] = {}
+    headers: dict[str, str] | None = None
     if params.auth:
         try:
-            headers.update(params.auth.build_header())
+            headers = params.auth.build_header()
         except ValueError as exc:
             logger.warning(
                 "Failed to build auth header for MCP server '%s': %s",
@@ -93,9 +153,10 @@ async def create_http_mcp_connection(
         # We need to manually manage the lifecycle
         client_context = streamablehttp_client(
             url=params.url,
-            headers=headers if headers else None,
+            headers=headers,
             timeout=params.timeout_seconds or _HTTP_CLIENT_DEFAULT_TIMEOUT,
             terminate_on_close=_HTTP_CLIENT_TERMINATE_ON_CLOSE,
+            httpx_client_factory=_create_http_client,
         )
 
         # Enter the context and get the streams
@@ -227,21 +288,7 @@ async def create_http_mcp_connection(
         error_type = type(exc).__name__
 
         # Try to extract HTTP status code from error message if possible
-        status_code_hint = ""
-        if "502" in error_msg or "Bad Gateway" in error_msg:
-            status_code_hint = (
-                " (Possible HTTP 502 Bad Gateway - target server unavailable)"
-            )
-        elif "401" in error_msg or "Unauthorized" in error_msg:
-            status_code_hint = (
-                " (Possible HTTP 401 Unauthorized - check authentication)"
-            )
-        elif "403" in error_msg or "Forbidden" in error_msg:
-            status_code_hint = " (Possible HTTP 403 Forbidden - check permissions)"
-        elif "404" in error_msg or "Not Found" in error_msg:
-            status_code_hint = " (Possible HTTP 404 Not Found - check URL)"
-        elif "timeout" in error_msg.lower():
-            status_code_hint = " (Connection timeout - server not responding)"
+        status_code_hint = _status_code_hint(error_msg)
 
         logger.error(
             "Failed to connect to HTTP MCP server '%s' at %s\n"
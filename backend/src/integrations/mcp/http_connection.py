@@ -19,7 +19,7 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class HTTPMCPConnection:
     """
     Represents a persistent HTTP/SSE MCP connection.
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
 from collections.abc import Collection
+from logging import DEBUG
 from typing import Any
 
+import orjson
 from agno.tools import Toolkit
 from agno.tools.function import Function
 from mcp import ClientSession
@@ -62,6 +65,25 @@ def get_tool_timeout(tool_name: str) -> float:
     return TOOL_TIMEOUT_CONFIG["default"]
 
 
+def _dump_structured_content(payload: Any) -> str:
+    """
+    Serialise MCP structured content as a JSON string.
+
+    orjson rejects integers wider than 64 bits and non-string dict keys,
+    so those payloads fall back to the standard library encoder.
+
+    Args:
+        payload: The tool result's structured content
+
+    Returns:
+        JSON text for the agent
+    """
+    try:
+        return orjson.dumps(payload, default=str).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(payload, default=str)
+
+
 class HTTPMCPToolkit(Toolkit):
     """
     Expose HTTP MCP server functions as an Agno toolkit.
@@ -92,7 +114,9 @@ class HTTPMCPToolkit(Toolkit):
         self._session = session
         self._tools = tools
         self._allowed = (
-            {name.strip() for name in allowed_functions} if allowed_functions else None
+            frozenset(name.strip() for name in allowed_functions)
+            if allowed_functions
+            else None
         )
         self._load_functions()
 
@@ -105,17 +129,20 @@ class HTTPMCPToolkit(Toolkit):
             )
             return
 
+        allowed = self._allowed
+        debug_enabled = logger.isEnabledFor(DEBUG)
         for tool in self._tools:
-            if self._allowed is not None and tool.name not in self._allowed:
+            if allowed is not None and tool.name not in allowed:
                 continue
 
             # Create a wrapper function for this tool
             self.functions[tool.name] = self._create_tool_wrapper(tool)
-            logger.debug(
-                "Registered HTTP MCP tool %s.%s",
-                self.server_name,
-                tool.name,
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Registered HTTP MCP tool %s.%s",
+                    self.server_name,
+                    tool.name,
+                )
 
         logger.info(
             "HTTP MCP toolkit '%s' loaded %s tool(s)",
@@ -164,29 +191,35 @@ class HTTPMCPToolkit(Toolkit):
                     timeout=tool_timeout,
                 )
 
-                # Extract text content from result
-                if result.content:
-                    # Concatenate all text content
-                    text_parts = []
-                    for content in result.content:
-                        if isinstance(content, TextContent):
-                            text_parts.append(content.text)
-                    return "\n".join(text_parts) if text_parts else str(result.content)
-
-                # If no content, return structured content or empty
+                # Concatenate all text content
+                text_parts = [
+                    content.text
+                    for content in result.content
+                    if isinstance(content, TextContent)
+                ]
+                if text_parts:
+                    return "\n".join(text_parts)
+
+                # Without text, prefer structured content over the repr of
+                # non-text blocks, which can be large (e.g. base64 images)
                 if result.structuredContent:
-                    return str(result.structuredContent)
+                    # Serialise as JSON so the agent gets a parseable payload
+                    return _dump_structured_content(result.structuredContent)
+
+                if result.content:
+                    return str(result.content)
 
                 return "Tool executed successfully (no output)"
 
             except TimeoutError as exc:
                 # Tool execution timeout
                 tool_timeout = get_tool_timeout(tool.name)
-                error_msg = (
-                    f"Tool '{tool.name}' on server '{self.server_name}' "
-                    f"timed out after {tool_timeout}s"
+                logger.error(
+                    "Tool '%s' on server '%s' timed out after %ss",
+                    tool.name,
+                    self.server_name,
+                    tool_timeout,
                 )
-                logger.error(error_msg)
                 raise MCPToolExecutionError(
                     server_name=self.server_name,
                     tool_name=tool.name,
@@ -194,10 +227,12 @@ class HTTPMCPToolkit(Toolkit):
                 ) from exc
             except Exception as exc:
                 # Other tool execution errors
-                error_msg = (
-                    f"Tool '{tool.name}' on server '{self.server_name}' failed: {exc}"
+                logger.error(
+                    "Tool '%s' on server '%s' failed: %s",
+                    tool.name,
+                    self.server_name,
+                    exc,
                 )
-                logger.error(error_msg)
                 raise MCPToolExecutionError(
                     server_name=self.server_name,
                     tool_name=tool.name,
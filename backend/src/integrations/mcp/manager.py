@@ -389,20 +389,36 @@ class MCPManager:
             }
         return functions
 
+    def _get_function_names(self, server_name: str) -> list[str]:
+        """Return function names without building the HTTP function dicts."""
+        server_data = self._servers.get(server_name)
+        if server_data is None:
+            return []
+
+        if not self._is_http_server(server_data):
+            return list(getattr(server_data, "functions", {}))
+
+        connection: HTTPMCPConnection = server_data  # type: ignore[assignment]
+        return [tool.name for tool in connection.tools]
+
     def _get_server_function_count(self, server_name: str) -> int:
-        return len(self.get_functions_for_server(server_name))
+        return len(self._get_function_names(server_name))
 
     def get_server_status(self) -> dict[str, dict[str, Any]]:
         status: dict[str, dict[str, Any]] = {}
-        names = {config.name for config in self._configs} | set(self._servers.keys())
-        for server_name in sorted(names):
-            functions = self.get_functions_for_server(server_name)
+        # First config wins for a repeated name, as in _get_server_description
+        configs: dict[str, MCPServerParams] = {}
+        for config in self._configs:
+            configs.setdefault(config.name, config)
+        for server_name in sorted(configs.keys() | self._servers.keys()):
+            functions = self._get_function_names(server_name)
+            config = configs.get(server_name)
             status[server_name] = {
                 "connected": server_name in self._servers,
                 "function_count": len(functions),
-                "functions": list(functions.keys()),
-                "description": self._get_server_description(server_name),
-                "enabled": self._is_server_enabled(server_name),
+                "functions": functions,
+                "description": config.description if config else "",
+                "enabled": config.enabled if config else False,
             }
         return status
 
@@ -477,7 +493,7 @@ class MCPManager:
             if server_name in self._servers:
                 await self._close_server(server_name)
 
-            # Reinitialize the server
+            # Reinitialize the server (response built from trusted local values)
             try:
                 await self._initialise_single_server(config)
                 function_count = self._get_server_function_count(server_name)
@@ -486,7 +502,7 @@ class MCPManager:
                     server_name,
                     function_count,
                 )
-                return ReloadMCPServerResponse(
+                return ReloadMCPServerResponse.model_construct(
                     server_name=server_name,
                     success=True,
                     message="Server reloaded successfully",
@@ -519,35 +535,46 @@ class MCPManager:
             for server_name in list(self._servers.keys()):
                 await self._close_server(server_name)
 
-            # Reinitialize all enabled servers
+            # Reinitialize all enabled servers; results are built from local,
+            # already-typed values so the response models skip validation
             results: list[ReloadMCPServerResponse] = []
             success_count = 0
             failed_count = 0
 
-            for config in enabled_configs:
-                try:
-                    await self._initialise_single_server(config)
-                    function_count = self._get_server_function_count(config.name)
-                    results.append(
-                        ReloadMCPServerResponse(
-                            server_name=config.name,
-                            success=True,
-                            message="Server reloaded successfully",
-                            function_count=function_count,
-                        )
+            # Servers connect concurrently so the reload waits for the slowest
+            # server rather than the sum of all handshakes
+            tasks = [
+                asyncio.create_task(self._initialise_single_server(config))
+                for config in enabled_configs
+            ]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+            for config, outcome in zip(enabled_configs, outcomes, strict=True):
+                if isinstance(outcome, Exception):
+                    logger.error(
+                        "Failed to reload server '%s': %s", config.name, outcome
                     )
-                    success_count += 1
-                except Exception as exc:
-                    logger.error("Failed to reload server '%s': %s", config.name, exc)
                     results.append(
-                        ReloadMCPServerResponse(
+                        ReloadMCPServerResponse.model_construct(
                             server_name=config.name,
                             success=False,
-                            message=f"Failed to reload: {exc!s}",
+                            message=f"Failed to reload: {outcome!s}",
                             function_count=0,
                         )
                     )
                     failed_count += 1
+                    continue
+
+                function_count = self._get_server_function_count(config.name)
+                results.append(
+                    ReloadMCPServerResponse.model_construct(
+                        server_name=config.name,
+                        success=True,
+                        message="Server reloaded successfully",
+                        function_count=function_count,
+                    )
+                )
+                success_count += 1
 
             logger.info(
                 "Reload complete: %s/%s servers successful",
@@ -555,7 +582,7 @@ class MCPManager:
                 len(enabled_configs),
             )
 
-            return ReloadAllMCPServersResponse(
+            return ReloadAllMCPServersResponse.model_construct(
                 success=success_count > 0,
                 reloaded_count=success_count,
                 failed_count=failed_count,
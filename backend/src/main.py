@@ -6,6 +6,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.exception_handlers import register_exception_handlers
 from src.api.mcp_server import initialize_mcp_server
+from src.api.v1 import conversation_router as conversation_api
+from src.api.v1 import mcp_router as mcp_api
 from src.api.v1.agno_router import router as agno_router
 from src.api.v1.conversation_router import router as conversation_router
 from src.api.v1.mcp_router import router as mcp_router
@@ -48,6 +50,12 @@ async def lifespan(app: FastAPI):
         mcp_http_app if mcp_http_app is not None else mcp_server.http_app(path="/")
     )
     async with mcp_app_for_lifespan.lifespan(app):
+        # Build the request-scoped singletons before accepting traffic so the
+        # first request does not pay for their construction
+        conversation_api.get_agent_factory().preload()
+        mcp_api.get_mcp_manager()
+        mcp_api.get_agent_factory()
+
         # Initialize MCP system on startup
         await initialize_mcp_system()
 
@@ -21,6 +21,7 @@ from .response import (
     APIResponse,
     BaseResponse,
     ErrorResponse,
+    FastORJSONResponse,
     PaginatedResponse,
     create_success_response,
 )
@@ -31,6 +32,7 @@ __all__ = [
     "APIResponse",
     "PaginatedResponse",
     "ErrorResponse",
+    "FastORJSONResponse",
     "create_success_response",
     # User-related exceptions
     "UserNotFoundError",
@@ -7,11 +7,38 @@ ensuring consistent client-server communication patterns.
 
 from typing import Any, TypeVar
 
+import orjson
+import pydantic_core
+from fastapi import Response
 from pydantic import BaseModel, ConfigDict, Field
 
 T = TypeVar("T")
 
 
+class FastORJSONResponse(Response):
+    """
+    JSON response rendered without FastAPI's ``jsonable_encoder`` pass.
+
+    Pydantic models are serialized directly by pydantic-core (honouring field
+    aliases); any other content goes through orjson, falling back to
+    pydantic-core for values orjson does not handle natively.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return pydantic_core.to_json(content, by_alias=True)
+        return orjson.dumps(
+            content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+def _orjson_default(value: Any) -> Any:
+    """Convert values orjson cannot serialize natively (e.g. nested models)."""
+    return pydantic_core.to_jsonable_python(value, by_alias=True)
+
+
 class BaseResponse(BaseModel):
     """
     Base response model with common configuration.
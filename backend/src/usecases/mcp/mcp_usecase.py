@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import tomllib
+from collections.abc import Awaitable, Callable
 from uuid import uuid4
 
 from src.config import settings
@@ -12,7 +13,11 @@ from src.integrations.llm import ConversationAgentFactory
 from src.integrations.mcp import manager as mcp_manager_module  # Keep for type hinting
 from src.integrations.mcp.config import mcp_settings
 from src.models import MCPToolSelection
-from src.models.conversation import ConversationMessage, ConversationRequest
+from src.models.conversation import (
+    ConversationMessage,
+    ConversationReply,
+    ConversationRequest,
+)
 from src.models.mcp import (
     ListMCPServersResponse,
     MCPServerInfo,
@@ -37,6 +42,7 @@ from src.shared.exceptions import (
     MCPServerNotFoundError,
     MCPServerReloadError,
 )
+from src.shared.exceptions.llm import LLMNoOutputError
 from src.usecases.conversation import ConversationUsecase
 
 logger = get_logger(__name__)
@@ -56,19 +62,21 @@ class MCPServerManagementUsecase:
     def list_servers(self) -> ListMCPServersResponse:
         """List all configured MCP servers and their status."""
         status = self.mcp_manager.get_system_status()
+        # get_server_status already produces correctly typed values, so the
+        # response models are built without re-validation.
         servers = [
-            MCPServerInfo(
+            MCPServerInfo.model_construct(
                 name=name,
-                description=info.get("description"),
-                connected=bool(info.get("connected")),
-                enabled=bool(info.get("enabled")),
-                function_count=int(info.get("function_count", 0)),
-                functions=info.get("functions", []),
+                description=info["description"],
+                connected=info["connected"],
+                enabled=info["enabled"],
+                function_count=info["function_count"],
+                functions=info["functions"],
             )
-            for name, info in status.get("servers", {}).items()
+            for name, info in status["servers"].items()
         ]
-        return ListMCPServersResponse(
-            initialized=bool(status.get("initialized", False)),
+        return ListMCPServersResponse.model_construct(
+            initialized=status["initialized"],
             servers=servers,
         )
 
@@ -85,7 +93,7 @@ class MCPServerManagementUsecase:
             logger.warning("MCP server reload failed validation: %s", e)
             # For tools, it's better to return a structured response than to raise
             # an HTTP exception that the tool caller may not understand.
-            return ReloadMCPServerResponse(
+            return ReloadMCPServerResponse.model_construct(
                 server_name=server_name,
                 success=False,
                 message=str(e),
@@ -246,10 +254,15 @@ class MCPChatUsecase:
         conversation_id: str | None = None,
         user_id: str = "peer-caller",
         tools: list[MCPToolSelection] | None = None,
+        on_delta: Callable[[str], Awaitable[None]] | None = None,
     ) -> MCPChatResponse:
         """
         Execute a natural language conversation through the local Agent,
         providing access to all configured MCP tools for a peer.
+
+        When ``on_delta`` is given the reply is streamed from the model and
+        each text delta is passed to it as soon as it arrives; the returned
+        response still carries the full reply.
         """
         logger.info(
             "Executing MCP chat use case for user=%s, model=%s",
@@ -267,7 +280,10 @@ class MCPChatUsecase:
                 tools=tools,  # Use provided tools or None
             )
 
-            reply = await usecase.generate_reply(request)
+            if on_delta is None:
+                reply = await usecase.generate_reply(request)
+            else:
+                reply = await self._stream_reply(usecase, request, on_delta)
 
             return MCPChatResponse(
                 success=True,
@@ -301,3 +317,34 @@ class MCPChatUsecase:
                 message_id=None,
                 error=f"An unexpected internal error occurred: {exc}",
             )
+
+    async def _stream_reply(
+        self,
+        usecase: ConversationUsecase,
+        request: ConversationRequest,
+        on_delta: Callable[[str], Awaitable[None]],
+    ) -> ConversationReply:
+        """Stream a reply, forwarding each delta and collecting the full text."""
+        deltas: list[str] = []
+        message_id: str | None = None
+        model_key: str | None = None
+
+        async for chunk in usecase.stream_reply(request):
+            deltas.append(chunk.delta)
+            message_id = chunk.message_id
+            model_key = chunk.model_key
+            await on_delta(chunk.delta)
+
+        content = "".join(deltas)
+        if not content:
+            # Same contract as the non-streaming generate_reply path
+            raise LLMNoOutputError(context={"conversation_id": request.conversation_id})
+
+        return ConversationReply(
+            conversation_id=request.conversation_id,
+            message_id=message_id or str(uuid4()),
+            content=content,
+            model_key=model_key
+            or request.model_key
+            or self.agent_factory.get_active_model_key(),
+        )
@@ -22,6 +22,18 @@ class TestAgnoConfigAPI:
         assert isinstance(data["data"]["toolkits"], list)
         assert isinstance(data["data"]["prompts"], list)
 
+    @pytest.mark.asyncio
+    async def test_get_config__serializes_with_aliases(self, client: AsyncClient):
+        """Test GET /api/v1/agno/config keeps camelCase serialization aliases."""
+        response = await client.get("/api/v1/agno/config")
+
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()["data"]
+        for toolkit in data["toolkits"]:
+            assert "toolkitClass" in toolkit
+        for prompt in data["prompts"]:
+            assert "instructionCount" in prompt
+
     @pytest.mark.asyncio
     async def test_update_toolkit__valid_key__returns_success(
         self, client: AsyncClient
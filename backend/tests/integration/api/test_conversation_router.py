@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from collections.abc import AsyncIterator, Iterator
 from types import SimpleNamespace
@@ -313,6 +314,38 @@ async def test_stream_conversation_reply__error_event__returns_error_response(
     }
 
 
+@pytest.mark.asyncio
+async def test_stream_conversation_reply__idle_stream__emits_heartbeat(
+    stub_factory: StubAgentFactory,
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def slow_events():
+        await asyncio.sleep(0.05)
+        yield _make_content_event("late", run_id="run-4")
+
+    stub_factory.agent.arun = lambda **kwargs: slow_events()
+    monkeypatch.setattr(conversation_router, "_HEARTBEAT_INTERVAL_SECONDS", 0.01)
+
+    async with async_client.stream(
+        "POST",
+        "/api/v1/conversation/stream",
+        json={
+            "conversationId": "conv-4",
+            "history": [{"role": "user", "content": "Hello"}],
+        },
+    ) as response:
+        body = ""
+        async for chunk in response.aiter_text():
+            body += chunk
+
+    messages = [line for line in body.split("\n\n") if line]
+
+    assert messages[0] == ": heartbeat"
+    assert messages[-1].startswith("data: ")
+    assert json.loads(messages[-1].removeprefix("data: "))["delta"] == "late"
+
+
 @pytest.mark.asyncio
 async def test_model_management_endpoints__list_and_upsert(
     stub_factory: StubAgentFactory,
@@ -0,0 +1,47 @@
+"""Unit tests for SSE frame coalescing in the conversation router."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from src.api.v1 import conversation_router
+from src.api.v1.conversation_router import _STREAM_END, _coalesce_frames
+
+
+@pytest.mark.asyncio
+async def test_coalesce_frames__queued_frames__merged_until_end() -> None:
+    queue: asyncio.Queue[object] = asyncio.Queue()
+    for frame in (b"data: 2\n\n", b"data: 3\n\n", _STREAM_END):
+        queue.put_nowait(frame)
+
+    payload, finished = await _coalesce_frames(queue, b"data: 1\n\n")
+
+    assert payload == b"data: 1\n\ndata: 2\n\ndata: 3\n\n"
+    assert finished is True
+
+
+@pytest.mark.asyncio
+async def test_coalesce_frames__empty_queue__flushes_after_window() -> None:
+    queue: asyncio.Queue[object] = asyncio.Queue()
+
+    payload, finished = await _coalesce_frames(queue, b"data: 1\n\n")
+
+    assert payload == b"data: 1\n\n"
+    assert finished is False
+
+
+@pytest.mark.asyncio
+async def test_coalesce_frames__byte_limit__stops_batching(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(conversation_router, "_COALESCE_MAX_BYTES", 16)
+    queue: asyncio.Queue[object] = asyncio.Queue()
+    for frame in (b"data: 2\n\n", b"data: 3\n\n"):
+        queue.put_nowait(frame)
+
+    payload, finished = await _coalesce_frames(queue, b"data: 1\n\n")
+
+    assert payload == b"data: 1\n\ndata: 2\n\n"
+    assert finished is False
+    assert queue.qsize() == 1
@@ -0,0 +1,142 @@
+"""Unit tests for the global exception handlers."""
+
+from __future__ import annotations
+
+import orjson
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from src.api.exception_handlers import (
+    register_exception_handlers,
+    unhandled_exception_handler,
+)
+from src.core import TraceMiddleware
+from src.core.exceptions import NotFoundError, ServiceUnavailableError
+
+
+class _Payload(BaseModel):
+    name: str
+    count: int
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/not-found")
+    def raise_not_found():
+        raise NotFoundError(context={"item_id": 7})
+
+    @app.get("/unavailable")
+    def raise_unavailable():
+        raise ServiceUnavailableError()
+
+    @app.get("/http")
+    def raise_http():
+        raise HTTPException(status_code=418, detail="teapot")
+
+    @app.post("/validate")
+    def validate(payload: _Payload):
+        return payload
+
+    @app.get("/boom")
+    def boom():
+        raise RuntimeError("unexpected")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_base_app_exception__returns_structured_error(client: TestClient) -> None:
+    response = client.get("/not-found")
+
+    assert response.status_code == 404
+    assert response.headers["content-type"] == "application/json"
+    error = response.json()["error"]
+    assert error["type"] == "NotFoundError"
+    assert error["message"] == "Resource not found"
+    assert error["context"] == {"item_id": 7}
+    assert error["i18n_key"] == "errors.notfounderror"
+    assert "retry_info" not in response.json()
+
+
+def test_base_app_exception__retryable_includes_retry_info(
+    client: TestClient,
+) -> None:
+    response = client.get("/unavailable")
+
+    assert response.status_code == 503
+    assert response.json()["retry_info"] == {
+        "retryable": True,
+        "retry_after": 30,
+        "max_retries": 3,
+        "current_attempt": 1,
+    }
+
+
+def test_http_exception__returns_detail_as_message(client: TestClient) -> None:
+    response = client.get("/http")
+
+    assert response.status_code == 418
+    assert response.json() == {
+        "success": False,
+        "error": {"type": "HTTPException", "message": "teapot", "trace_id": None},
+    }
+
+
+def test_validation_error__flattens_field_paths(client: TestClient) -> None:
+    response = client.post("/validate", json={"name": "x", "count": "many"})
+
+    assert response.status_code == 422
+    error = response.json()["error"]
+    assert error["type"] == "ValidationError"
+    assert error["details"] == [
+        {
+            "field": "body -> count",
+            "message": "Input should be a valid integer, unable to parse string "
+            "as an integer",
+            "type": "int_parsing",
+            "input": "many",
+        }
+    ]
+
+
+def test_unhandled_exception__returns_generic_message(client: TestClient) -> None:
+    response = client.get("/boom")
+
+    assert response.status_code == 500
+    assert response.json() == {
+        "success": False,
+        "error": {
+            "type": "InternalServerError",
+            "message": "An unexpected error occurred. Please try again later.",
+            "trace_id": None,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_unhandled_exception__splices_trace_id_into_body() -> None:
+    request = Request({"type": "http", "method": "GET", "path": "/boom", "headers": []})
+    request.state.trace_id = 'trace-"1"'
+
+    response = await unhandled_exception_handler(request, RuntimeError("x"))
+
+    assert response.status_code == 500
+    assert orjson.loads(response.body)["error"]["trace_id"] == 'trace-"1"'
+
+
+def test_http_exception__behind_trace_middleware__echoes_trace_id() -> None:
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.add_middleware(TraceMiddleware)
+
+    @app.get("/missing")
+    def raise_missing():
+        raise HTTPException(status_code=404, detail="missing")
+
+    response = TestClient(app).get("/missing")
+
+    assert response.status_code == 404
+    assert response.json()["error"]["trace_id"] == response.headers["x-trace-id"]
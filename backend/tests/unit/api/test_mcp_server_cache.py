@@ -0,0 +1,125 @@
+"""Unit tests for the MCP server read-only tool result cache."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import Client, FastMCP
+from src.api import mcp_server
+from src.models.mcp_tools import ListAvailableModelsResponse
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache() -> Iterator[None]:
+    mcp_server.clear_tool_cache()
+    yield
+    mcp_server.clear_tool_cache()
+
+
+def test_cached_tool_result__repeated_call__reuses_result() -> None:
+    calls: list[int] = []
+
+    def producer() -> list[str]:
+        calls.append(1)
+        return ["alpha"]
+
+    first = mcp_server._cached_tool_result(("servers",), producer)
+    second = mcp_server._cached_tool_result(("servers",), producer)
+
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_cached_tool_result__expired_entry__calls_producer_again(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = [100.0]
+    monkeypatch.setattr(mcp_server.time, "monotonic", lambda: now[0])
+    calls: list[int] = []
+
+    def producer() -> list[str]:
+        calls.append(1)
+        return ["alpha"]
+
+    mcp_server._cached_tool_result(("servers",), producer)
+    now[0] += mcp_server._TOOL_CACHE_TTL_SECONDS + 1
+    mcp_server._cached_tool_result(("servers",), producer)
+
+    assert len(calls) == 2
+
+
+def test_cached_tool_result__error_result__is_not_cached() -> None:
+    calls: list[int] = []
+
+    def producer() -> ListAvailableModelsResponse:
+        calls.append(1)
+        return ListAvailableModelsResponse(
+            models=[], active_model="", total_count=0, error="boom"
+        )
+
+    mcp_server._cached_tool_result(("models",), producer)
+    mcp_server._cached_tool_result(("models",), producer)
+
+    assert len(calls) == 2
+
+
+def test_clear_tool_cache__drops_entries() -> None:
+    calls: list[int] = []
+
+    def producer() -> list[str]:
+        calls.append(1)
+        return ["alpha"]
+
+    mcp_server._cached_tool_result(("functions", "a"), producer)
+    mcp_server.clear_tool_cache()
+    mcp_server._cached_tool_result(("functions", "a"), producer)
+
+    assert len(calls) == 2
+
+
+def test_cached_tool_result__full_cache__evicts_oldest_entry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(mcp_server, "_TOOL_CACHE_MAXSIZE", 2)
+
+    for name in ("a", "b", "c"):
+        mcp_server._cached_tool_result(("functions", name), list)
+
+    assert list(mcp_server._tool_cache) == [("functions", "b"), ("functions", "c")]
+
+
+def test_cached_tool_result__full_cache__purges_expired_entries_first(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = [100.0]
+    monkeypatch.setattr(mcp_server.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(mcp_server, "_TOOL_CACHE_MAXSIZE", 3)
+    mcp_server._cached_tool_result(("functions", "old"), lambda: ["old"])
+    now[0] += mcp_server._TOOL_CACHE_TTL_SECONDS + 1
+    mcp_server._cached_tool_result(("functions", "a"), lambda: ["a"])
+    mcp_server._cached_tool_result(("functions", "b"), lambda: ["b"])
+
+    mcp_server._cached_tool_result(("functions", "c"), lambda: ["c"])
+
+    assert list(mcp_server._tool_cache) == [
+        ("functions", "a"),
+        ("functions", "b"),
+        ("functions", "c"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_mcp_server_functions__unknown_server__is_not_cached() -> None:
+    usecase = MagicMock()
+    usecase.get_available_servers.return_value = ["known"]
+    usecase.get_server_functions.return_value = []
+    server = FastMCP("test")
+    mcp_server._register_mcp_tools(server, usecase, MagicMock())
+
+    async with Client(server) as client:
+        await client.call_tool("get_mcp_server_functions", {"server_name": "ghost"})
+        await client.call_tool("get_mcp_server_functions", {"server_name": "known"})
+
+    assert list(mcp_server._tool_cache) == [("get_mcp_server_functions", "known")]
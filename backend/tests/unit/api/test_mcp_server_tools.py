@@ -0,0 +1,37 @@
+"""Unit tests for MCP server tool argument handling."""
+
+from __future__ import annotations
+
+import pytest
+from fastmcp.exceptions import ToolError
+from src.api import mcp_server
+
+
+def test_parse_tool_selections__valid_entries__returns_selections() -> None:
+    selections = mcp_server._parse_tool_selections(
+        [{"server": "alpha", "functions": ["a", "b"]}, {"server": "beta"}]
+    )
+
+    assert selections is not None
+    assert [(s.server, s.functions) for s in selections] == [
+        ("alpha", ["a", "b"]),
+        ("beta", None),
+    ]
+
+
+def test_parse_tool_selections__empty__returns_none() -> None:
+    assert mcp_server._parse_tool_selections(None) is None
+    assert mcp_server._parse_tool_selections([]) is None
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        {"functions": ["a"]},
+        {"server": {"a": 1}},
+        {"server": "alpha", "functions": "abc"},
+    ],
+)
+def test_parse_tool_selections__invalid_entry__raises_tool_error(entry) -> None:
+    with pytest.raises(ToolError):
+        mcp_server._parse_tool_selections([entry])
@@ -0,0 +1,57 @@
+"""Tests for the core application exception hierarchy."""
+
+import pytest
+from src.core.exceptions import (
+    BaseAppException,
+    NotFoundError,
+    ServiceUnavailableError,
+    TooManyRequestsError,
+    TooManyToolsError,
+)
+
+
+def test_i18n_key__defaults_to_lowercased_class_name():
+    """Test every class derives its own default i18n key."""
+    assert BaseAppException("boom").i18n_key == "errors.baseappexception"
+    assert NotFoundError().i18n_key == "errors.notfounderror"
+
+
+def test_i18n_key__explicit_key_wins_over_class_default():
+    """Test an i18n key passed at raise time overrides the class default."""
+    error = NotFoundError(i18n_key="errors.model_config.not_found")
+
+    assert error.i18n_key == "errors.model_config.not_found"
+
+
+def test_i18n_key__pinned_in_class_body_is_kept():
+    """Test subclasses can pin a custom default i18n key."""
+    assert TooManyToolsError().i18n_key == "errors.tooManyTools"
+
+
+def test_retry_defaults__applied_and_overridable():
+    """Test retryable errors use class retry defaults unless overridden."""
+    default = TooManyRequestsError()
+    custom = ServiceUnavailableError(retry_after=5, max_retries=1)
+
+    assert (default.retryable, default.retry_after, default.max_retries) == (
+        True,
+        60,
+        5,
+    )
+    assert (custom.retryable, custom.retry_after, custom.max_retries) == (True, 5, 1)
+
+
+def test_omitted_mappings__share_one_read_only_empty_mapping():
+    """Test omitted context and i18n params do not allocate per raise."""
+    first = NotFoundError()
+    second = TooManyRequestsError()
+
+    assert first.context == {}
+    assert first.i18n_params == {}
+    assert first.context is second.context is second.i18n_params
+
+
+def test_retry_defaults__class_mapping_is_read_only():
+    """Test the shared retry defaults cannot be mutated through one class."""
+    with pytest.raises(TypeError):
+        ServiceUnavailableError._RETRY_DEFAULTS["retry_after"] = 1  # type: ignore[index]
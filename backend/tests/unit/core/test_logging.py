@@ -0,0 +1,46 @@
+"""Unit tests for the queue-based logging pipeline."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sys
+
+from src.core import logging as app_logging
+
+
+def _make_record(msg: str, *args: object, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord(
+        name="test",
+        level=logging.ERROR,
+        pathname=__file__,
+        lineno=1,
+        msg=msg,
+        args=args,
+        exc_info=exc_info,
+    )
+
+
+def test_deferred_queue_handler__merges_message_and_keeps_exc_info() -> None:
+    handler = app_logging.DeferredQueueHandler(queue.Queue())
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = _make_record("failed %s", "job", exc_info=sys.exc_info())
+
+    prepared = handler.prepare(record)
+
+    assert prepared is not record
+    assert prepared.getMessage() == "failed job"
+    assert prepared.args is None
+    assert prepared.exc_info is not None
+    assert prepared.exc_text is None
+
+
+def test_setup_logging__root_logs_through_running_listener() -> None:
+    app_logging.setup_logging(log_level="INFO")
+
+    handlers = logging.getLogger().handlers
+    assert [type(h) for h in handlers] == [app_logging.DeferredQueueHandler]
+    assert app_logging._queue_listener is not None
+    assert app_logging._queue_listener._thread is not None
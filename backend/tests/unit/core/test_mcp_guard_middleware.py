@@ -3,7 +3,7 @@
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from src.core.middleware import MCPServerGuardMiddleware
+from src.core.middleware import MCPServerGuardMiddleware, TraceMiddleware
 
 
 @pytest.fixture
@@ -20,6 +20,10 @@ def app_with_mcp_disabled():
     def test_endpoint():
         return {"status": "ok"}
 
+    @app.get("/mcpx")
+    def prefixed_endpoint():
+        return {"status": "ok"}
+
     return app
 
 
@@ -121,3 +125,31 @@ def test_error_message_content(app_with_mcp_disabled):
     # Check context
     assert "hint" in error["context"]
     assert "ENABLE_MCP_SYSTEM=true" in error["context"]["hint"]
+
+
+def test_path_sharing_mcp_prefix_not_blocked(app_with_mcp_disabled):
+    """Test that only /mcp and paths below it are guarded."""
+    client = TestClient(app_with_mcp_disabled)
+
+    response = client.get("/mcpx")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+
+
+def test_blocked_response_includes_trace_id_behind_trace_middleware():
+    """Test that the trace ID is spliced into the pre-serialized error body."""
+    app = FastAPI()
+    app.add_middleware(
+        MCPServerGuardMiddleware,
+        as_a_mcp_server=False,
+        enable_mcp_system=True,
+    )
+    app.add_middleware(TraceMiddleware)
+    client = TestClient(app)
+
+    response = client.post("/mcp")
+
+    assert response.status_code == 503
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["error"]["trace_id"] == response.headers["x-trace-id"]
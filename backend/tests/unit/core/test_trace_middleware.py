@@ -0,0 +1,63 @@
+"""Tests for TraceMiddleware."""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from src.core.middleware import TraceMiddleware, get_trace_id
+from starlette.responses import StreamingResponse
+
+
+@pytest.fixture
+def client():
+    """Create a test client for an app wrapped in TraceMiddleware."""
+    app = FastAPI()
+    app.add_middleware(TraceMiddleware)
+
+    @app.get("/trace")
+    def read_trace(request: Request):
+        return {"trace_id": request.state.trace_id}
+
+    @app.get("/context")
+    async def read_context():
+        return {"trace_id": get_trace_id()}
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"a", b"b"]), media_type="text/plain")
+
+    return TestClient(app)
+
+
+def test_trace_header_matches_request_state(client):
+    """Test the X-Trace-ID header echoes the trace ID seen by the endpoint."""
+    response = client.get("/trace")
+
+    assert response.status_code == 200
+    assert response.headers["x-trace-id"] == response.json()["trace_id"]
+    assert len(response.headers["x-trace-id"]) == 32
+    assert float(response.headers["x-process-time"]) >= 0
+
+
+def test_trace_ids_are_unique_per_request(client):
+    """Test every request receives a fresh trace ID."""
+    first = client.get("/trace").headers["x-trace-id"]
+    second = client.get("/trace").headers["x-trace-id"]
+
+    assert first != second
+
+
+def test_streaming_response_gets_trace_headers(client):
+    """Test streamed responses keep their body and receive trace headers."""
+    response = client.get("/stream")
+
+    assert response.text == "ab"
+    assert "x-trace-id" in response.headers
+    assert "x-process-time" in response.headers
+
+
+def test_trace_id_context_var_matches_header(client):
+    """Test get_trace_id() exposes the current trace ID inside the request."""
+    response = client.get("/context")
+
+    assert response.json()["trace_id"] == response.headers["x-trace-id"]
+    assert get_trace_id() is None
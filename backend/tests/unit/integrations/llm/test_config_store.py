@@ -9,15 +9,6 @@ from src.core.exceptions import NotFoundError
 from src.integrations.llm import LLMModelConfig, ModelConfigStore
 
 
-@pytest.fixture(autouse=True)
-def reset_singleton():
-    """Reset ModelConfigStore singleton between tests."""
-    yield
-    # Reset singleton state after each test
-    ModelConfigStore._instance = None
-    ModelConfigStore._class_initialized = False
-
-
 def _make_store(tmp_path) -> ModelConfigStore:
     models_path = tmp_path / "models.json"
     active_path = tmp_path / "active.json"
@@ -78,3 +69,43 @@ def test_get_active_model_key__invalid_json__raises_value_error(tmp_path) -> Non
 
     with pytest.raises(ValueError):
         store.get_active_model_key()
+
+
+def test_get_config__repeated_reads__served_from_cache(tmp_path, monkeypatch) -> None:
+    store = _make_store(tmp_path)
+    key = store.list_configs()[0].key
+    store.get_config(key)
+
+    def fail_read(*args, **kwargs):
+        raise AssertionError("models file should not be re-read")
+
+    monkeypatch.setattr(type(store._models_path), "read_text", fail_read)
+
+    assert store.get_config(key).key == key
+    assert store.list_configs()
+
+
+def test_list_configs__external_edit__reloads_file(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.list_configs()
+    registry = {
+        "models": [
+            {"key": "edited:model", "provider": "openai", "model_id": "gpt-edit"}
+        ]
+    }
+
+    store._models_path.write_text(json.dumps(registry), encoding="utf-8")
+
+    assert [cfg.key for cfg in store.list_configs()] == ["edited:model"]
+
+
+def test_constructor__distinct_paths__returns_independent_stores(tmp_path) -> None:
+    first = _make_store(tmp_path / "a")
+    second = _make_store(tmp_path / "b")
+
+    first.upsert_config(
+        LLMModelConfig(key="only:first", provider="openai", model_id="gpt-first")
+    )
+
+    assert first is not second
+    assert "only:first" not in {cfg.key for cfg in second.list_configs()}
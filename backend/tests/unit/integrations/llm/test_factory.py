@@ -0,0 +1,39 @@
+"""Unit tests for ConversationAgentFactory."""
+
+from __future__ import annotations
+
+from src.integrations.llm import ConversationAgentFactory, ModelConfigStore
+from src.integrations.llm.prompts_store import PromptsConfigStore
+from src.integrations.llm.tools_store import ToolsConfigStore
+
+
+def _make_factory(tmp_path) -> ConversationAgentFactory:
+    return ConversationAgentFactory(
+        store=ModelConfigStore(
+            models_path=tmp_path / "models.json",
+            active_path=tmp_path / "active.json",
+        ),
+        tools_store=ToolsConfigStore(config_path=tmp_path / "tools.json"),
+        prompts_store=PromptsConfigStore(config_path=tmp_path / "prompts.json"),
+    )
+
+
+def test_create_agent__same_model__reuses_built_model(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    factory = _make_factory(tmp_path)
+
+    first = factory.create_agent()
+    second = factory.create_agent()
+
+    assert first is not second
+    assert first.model is second.model
+
+
+def test_set_active_model_key__clears_built_models(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    factory = _make_factory(tmp_path)
+    first = factory.create_agent()
+
+    factory.set_active_model_key(factory.get_active_model_key())
+
+    assert factory.create_agent().model is not first.model
@@ -4,7 +4,10 @@ import json
 
 import pytest
 from src.integrations.llm.prompts_config import AgnoPromptsConfig, PromptConfig
-from src.integrations.llm.prompts_store import PromptsConfigStore
+from src.integrations.llm.prompts_store import (
+    PromptsConfigStore,
+    default_prompts_store,
+)
 from src.shared.exceptions.agno import PromptNotFoundError
 
 
@@ -174,3 +177,27 @@ def test_update_prompt_enabled__nonexistent_key__raises_error(config_file):
         store.update_prompt_enabled("nonexistent", True)
 
     assert "nonexistent" in str(exc_info.value)
+
+
+def test_config__after_update__reflects_new_state(config_file):
+    """Test the config property sees updates without re-reading the file."""
+    store = PromptsConfigStore(config_path=config_file)
+
+    store.update_prompt_enabled("analytical", True)
+
+    prompt = next(p for p in store.config.prompts if p.key == "analytical")
+    assert prompt.enabled is True
+
+
+def test_get_instructions__after_enabling_prompt__returns_instructions(config_file):
+    """Test the key index sees in-place enabled updates."""
+    store = PromptsConfigStore(config_path=config_file)
+
+    store.update_prompt_enabled("analytical", True)
+
+    assert store.get_instructions("analytical") == ["analyze this", "be detailed"]
+
+
+def test_default_prompts_store__repeated_calls__returns_shared_instance():
+    """Test the default store is created once per process."""
+    assert default_prompts_store() is default_prompts_store()
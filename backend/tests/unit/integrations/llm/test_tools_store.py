@@ -7,10 +7,19 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from src.integrations.llm import tools_store
 from src.integrations.llm.tools_store import ToolsConfigStore
 from src.shared.exceptions import ToolkitLoadError, ToolkitNotFoundError
 
 
+@pytest.fixture(autouse=True)
+def clear_toolkit_class_cache():
+    """Isolate tests from toolkit classes resolved by earlier tests."""
+    tools_store._TOOLKIT_CLASSES.clear()
+    yield
+    tools_store._TOOLKIT_CLASSES.clear()
+
+
 @pytest.fixture
 def temp_config_file(tmp_path: Path) -> Path:
     """Create a temporary config file for testing."""
@@ -140,6 +149,24 @@ def test_load_toolkit_instances__successful_import__returns_instances(
     mock_import.assert_called_once_with("agno.tools.duckduckgo")
 
 
+@patch("src.integrations.llm.tools_store.importlib.import_module")
+def test_load_toolkit_instances__repeated_calls__imports_module_once(
+    mock_import: MagicMock,
+    temp_config_file: Path,
+) -> None:
+    """Test resolved toolkit classes are reused across loads."""
+    mock_module = MagicMock()
+    mock_import.return_value = mock_module
+
+    store = ToolsConfigStore(config_path=temp_config_file)
+    store.load_toolkit_instances(strict=False)
+    instances = store.load_toolkit_instances(strict=False)
+
+    assert len(instances) == 1
+    mock_import.assert_called_once_with("agno.tools.duckduckgo")
+    assert mock_module.DuckDuckGoTools.call_count == 2
+
+
 @patch("src.integrations.llm.tools_store.importlib.import_module")
 def test_load_toolkit_instances__import_error__non_strict__returns_partial(
     mock_import: MagicMock,
@@ -216,3 +243,62 @@ def test_update_toolkit_enabled__saves_to_file(temp_config_file: Path) -> None:
     config = store._load_config()
     toolkit = next(tk for tk in config.toolkits if tk.key == "test_toolkit")
     assert toolkit.enabled is True
+
+
+def test_config__repeated_access__reads_file_once(temp_config_file: Path) -> None:
+    """Test the config property reuses the parsed configuration."""
+    store = ToolsConfigStore(config_path=temp_config_file)
+
+    first = store.config
+    temp_config_file.write_text(json.dumps({"toolkits": [], "custom_tools": []}))
+
+    assert store.config is first
+    assert len(store.config.toolkits) == 2
+
+
+def test_get_enabled_toolkits__after_update__reflects_new_state(
+    temp_config_file: Path,
+) -> None:
+    """Test the cached enabled view follows enable/disable updates."""
+    store = ToolsConfigStore(config_path=temp_config_file)
+    first = store.get_enabled_toolkits()
+
+    assert store.get_enabled_toolkits() is first
+
+    store.update_toolkit_enabled("disabled_toolkit", True)
+
+    assert [tk.key for tk in store.get_enabled_toolkits()] == [
+        "test_toolkit",
+        "disabled_toolkit",
+    ]
+
+
+def test_update_toolkit_enabled__unchanged_state__skips_write(
+    temp_config_file: Path,
+) -> None:
+    """Test setting a toolkit to its current state leaves the file alone."""
+    store = ToolsConfigStore(config_path=temp_config_file)
+    _ = store.config
+    temp_config_file.unlink()
+
+    store.update_toolkit_enabled("test_toolkit", True)
+
+    assert not temp_config_file.exists()
+
+
+def test_update_toolkit_enabled__replaces_file_without_leftovers(
+    temp_config_file: Path,
+) -> None:
+    """Test the config is swapped in whole, leaving no temporary file."""
+    store = ToolsConfigStore(config_path=temp_config_file)
+
+    store.update_toolkit_enabled("test_toolkit", False)
+
+    assert [p.name for p in temp_config_file.parent.iterdir()] == ["agno_tools.json"]
+    saved = json.loads(temp_config_file.read_text())
+    assert saved["toolkits"][0]["enabled"] is False
+
+
+def test_default_tools_store__repeated_calls__returns_shared_instance() -> None:
+    """Test the default store is created once per process."""
+    assert tools_store.default_tools_store() is tools_store.default_tools_store()
@@ -7,7 +7,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 from mcp.types import Tool
-from src.integrations.mcp.http_client import create_http_mcp_connection
+from src.integrations.mcp.http_client import (
+    _create_http_client,
+    _status_code_hint,
+    create_http_mcp_connection,
+)
 from src.integrations.mcp.http_connection import HTTPMCPConnection
 from src.integrations.mcp.server_params import (
     AuthType,
@@ -430,3 +434,43 @@ class TestCreateHTTPMCPConnection:
             call_kwargs = mock_streamable.call_args.kwargs
             # No headers should be passed when auth fails
             assert call_kwargs.get("headers") is None
+
+
+class TestStatusCodeHint:
+    """Test status hints derived from SDK error messages."""
+
+    @pytest.mark.parametrize(
+        ("error_msg", "expected"),
+        [
+            ("upstream said 502", "HTTP 502"),
+            ("401 and then Bad Gateway", "HTTP 502"),
+            ("Forbidden", "HTTP 403"),
+            ("Not Found while reading timeout", "HTTP 404"),
+            ("Read Timeout", "timeout"),
+        ],
+    )
+    def test_status_code_hint_with_message_expects_first_matching_hint(
+        self, error_msg, expected
+    ):
+        """Test earlier status codes take priority over later ones."""
+        assert expected in _status_code_hint(error_msg)
+
+    def test_status_code_hint_with_unrelated_message_expects_empty(self):
+        """Test messages without a known status get no hint."""
+        assert _status_code_hint("something else") == ""
+
+
+class TestCreateHTTPClient:
+    """Test the HTTP client handed to the MCP SDK."""
+
+    @pytest.mark.asyncio
+    async def test_create_http_client_with_sdk_timeout_expects_capped_connect(self):
+        """Test connect/pool waits are capped while read/write are kept."""
+        client = _create_http_client(timeout=httpx.Timeout(120, read=300))
+
+        async with client:
+            assert client.timeout.connect == 10.0
+            assert client.timeout.pool == 10.0
+            assert client.timeout.read == 300
+            assert client.timeout.write == 120
+            assert client.follow_redirects is True
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from mcp.types import CallToolResult, TextContent, Tool
+from mcp.types import CallToolResult, ImageContent, TextContent, Tool
 from src.integrations.mcp.http_connection import HTTPMCPConnection
 from src.integrations.mcp.http_toolkit import HTTPMCPToolkit
 from src.shared.exceptions.mcp import MCPToolExecutionError
@@ -384,10 +385,10 @@ class TestHTTPMCPToolkit:
         assert "functions=2" in repr_str
 
     @pytest.mark.asyncio
-    async def test_call_tool_with_structured_content_expects_string_conversion(
+    async def test_call_tool_with_structured_content_expects_json_string(
         self, mock_session, sample_tools
     ):
-        """Test calling tool with structured content converts to string."""
+        """Test calling tool with structured content returns it as JSON."""
         # Arrange
         toolkit = HTTPMCPToolkit(
             server_name="structured-server",
@@ -407,5 +408,51 @@ class TestHTTPMCPToolkit:
         output = await weather_func.entrypoint(city="Miami")  # type: ignore
 
         # Assert
-        assert "temperature" in output
-        assert "72" in output
+        assert json.loads(output) == {"temperature": 72, "unit": "F"}
+
+    @pytest.mark.asyncio
+    async def test_call_tool_with_oversized_int_structured_content_expects_json(
+        self, mock_session, sample_tools
+    ):
+        """Test structured content orjson cannot encode still returns JSON."""
+        # Arrange
+        toolkit = HTTPMCPToolkit(
+            server_name="bigint-server",
+            session=mock_session,
+            tools=sample_tools,
+        )
+        result = CallToolResult(
+            content=[],
+            structuredContent={"id": 2**70, "nested": {1: "one"}},
+        )
+        mock_session.call_tool = AsyncMock(return_value=result)
+
+        # Act
+        output = await toolkit.functions["get_weather"].entrypoint(city="Lima")  # type: ignore
+
+        # Assert
+        assert json.loads(output) == {"id": 2**70, "nested": {"1": "one"}}
+
+    @pytest.mark.asyncio
+    async def test_call_tool_with_image_and_structured_content_expects_structured(
+        self, mock_session, sample_tools
+    ):
+        """Test structured content wins over the repr of non-text blocks."""
+        # Arrange
+        toolkit = HTTPMCPToolkit(
+            server_name="image-server",
+            session=mock_session,
+            tools=sample_tools,
+        )
+        result = CallToolResult(
+            content=[ImageContent(type="image", data="aGVsbG8=", mimeType="image/png")],
+            structuredContent={"width": 1},
+        )
+        mock_session.call_tool = AsyncMock(return_value=result)
+
+        # Act
+        output = await toolkit.functions["get_weather"].entrypoint(city="Oslo")  # type: ignore
+
+        # Assert
+        assert "width" in output
+        assert "aGVsbG8=" not in output
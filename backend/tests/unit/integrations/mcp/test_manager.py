@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -313,6 +314,39 @@ class TestMCPManagerReloadAllServers:
             success_count = sum(1 for s in result.results if s.success)
             assert success_count == 1
 
+    @pytest.mark.asyncio
+    async def test_reload_all_servers_with_multiple_servers_expects_concurrent_init(
+        self, mcp_manager, mock_params_manager
+    ):
+        """Test servers are reinitialised concurrently rather than one by one."""
+        # Arrange
+        configs = [
+            MCPServerParams(
+                name=f"server{i}", enabled=True, command="node", args=[], env={}
+            )
+            for i in range(2)
+        ]
+        mock_params_manager.get_default_params.return_value = configs
+        started: set[str] = set()
+        all_started = asyncio.Event()
+
+        async def initialise(config):
+            started.add(config.name)
+            if len(started) == len(configs):
+                all_started.set()
+            # Only completes if every server has started before any finishes
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+
+        with patch.object(
+            mcp_manager, "_initialise_single_server", side_effect=initialise
+        ):
+            # Act
+            result = await mcp_manager.reload_all_servers()
+
+        # Assert
+        assert result.reloaded_count == 2
+        assert [r.server_name for r in result.results] == ["server0", "server1"]
+
     @pytest.mark.asyncio
     async def test_reload_all_servers_with_removed_server_expects_server_removed(
         self, mcp_manager, mock_params_manager
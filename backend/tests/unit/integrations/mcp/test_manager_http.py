@@ -125,3 +125,16 @@ class TestMCPManagerHTTPIntegration:
     def test_is_http_server_with_stdio_expects_false(self, mcp_manager):
         """Test stdio tools is not HTTP server."""
         assert mcp_manager._is_http_server(MagicMock()) is False
+
+    def test_get_server_status_with_http_expects_tool_names(
+        self, mcp_manager, http_config, mock_http_conn
+    ):
+        """Test HTTP server status lists tool names from the connection."""
+        mcp_manager._configs = [http_config]
+        mcp_manager._servers[http_config.name] = mock_http_conn
+
+        status = mcp_manager.get_server_status()
+
+        assert status[http_config.name]["functions"] == ["http_tool"]
+        assert status[http_config.name]["function_count"] == 1
+        assert status[http_config.name]["connected"] is True
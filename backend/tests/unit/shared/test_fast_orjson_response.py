@@ -0,0 +1,31 @@
+"""Unit tests for FastORJSONResponse rendering."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import orjson
+from pydantic import BaseModel, Field
+from src.shared.response import FastORJSONResponse
+
+
+class _Item(BaseModel):
+    item_name: str = Field(serialization_alias="itemName")
+
+
+def test_render__pydantic_model__uses_aliases() -> None:
+    response = FastORJSONResponse(_Item(item_name="a"))
+
+    assert response.body == b'{"itemName":"a"}'
+    assert response.media_type == "application/json"
+
+
+def test_render__nested_model_in_dict__falls_back_to_pydantic() -> None:
+    response = FastORJSONResponse(
+        {"items": [_Item(item_name="a")], 1: datetime(2025, 1, 1, tzinfo=UTC)}
+    )
+
+    assert orjson.loads(response.body) == {
+        "items": [{"itemName": "a"}],
+        "1": "2025-01-01T00:00:00+00:00",
+    }
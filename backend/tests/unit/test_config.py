@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import os
 import warnings
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -326,3 +327,28 @@ class TestSettingsCORSConfiguration:
 
         # Assert
         assert origins == ["https://app.example.com"]
+
+
+class TestSettingsPathValidation:
+    """Test model file path validation against the project root."""
+
+    def test_models_file_outside_project_expects_value_error(self):
+        """Test paths escaping the working directory are rejected."""
+        # Arrange
+        with patch.dict(os.environ, {"LLM_MODELS_FILE": "../outside.json"}):
+            # Act & Assert
+            with pytest.raises(ValueError, match="within the project directory"):
+                Settings()
+
+    def test_models_file_relative_path_expects_resolved_under_cwd(self):
+        """Test repeated validation resolves to the same absolute path."""
+        # Arrange
+        with patch.dict(os.environ, {"LLM_MODELS_FILE": "config/models.json"}):
+            # Act
+            first = Settings().llm_models_file
+            second = Settings().llm_models_file
+
+        # Assert
+        assert first == second
+        assert first.is_absolute()
+        assert first.parent.parent == Path.cwd().resolve()
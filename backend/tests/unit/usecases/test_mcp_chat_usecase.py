@@ -0,0 +1,106 @@
+"""Unit tests for the MCP chat use case."""
+
+from __future__ import annotations
+
+from typing import cast
+
+import pytest
+from src.integrations.llm import ConversationAgentFactory
+from src.models.conversation import (
+    ConversationReply,
+    ConversationRequest,
+    ConversationStreamChunk,
+)
+from src.usecases.conversation import ConversationUsecase
+from src.usecases.mcp.mcp_usecase import MCPChatUsecase
+
+pytestmark = [pytest.mark.unit, pytest.mark.application]
+
+
+class StubAgentFactory:
+    def get_active_model_key(self) -> str:
+        return "openai:gpt-5-mini"
+
+
+@pytest.fixture
+def chat_usecase() -> MCPChatUsecase:
+    return MCPChatUsecase(
+        agent_factory=cast(ConversationAgentFactory, StubAgentFactory())
+    )
+
+
+@pytest.mark.asyncio
+async def test_chat__with_on_delta__streams_and_returns_full_reply(
+    chat_usecase: MCPChatUsecase, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def stream_reply(self, payload: ConversationRequest):
+        for delta in ("Hel", "lo"):
+            yield ConversationStreamChunk(
+                conversation_id=payload.conversation_id,
+                message_id="run-1",
+                delta=delta,
+                model_key="openai:gpt-5-mini",
+            )
+
+    monkeypatch.setattr(ConversationUsecase, "stream_reply", stream_reply)
+    received: list[str] = []
+
+    async def on_delta(delta: str) -> None:
+        received.append(delta)
+
+    response = await chat_usecase.chat(
+        "hi", conversation_id="conv-1", on_delta=on_delta
+    )
+
+    assert received == ["Hel", "lo"]
+    assert response.success is True
+    assert response.content == "Hello"
+    assert response.message_id == "run-1"
+    assert response.conversation_id == "conv-1"
+
+
+@pytest.mark.asyncio
+async def test_chat__without_on_delta__generates_single_reply(
+    chat_usecase: MCPChatUsecase, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def generate_reply(self, payload: ConversationRequest):
+        return ConversationReply(
+            conversation_id=payload.conversation_id,
+            message_id="run-2",
+            content="Answer",
+            model_key="openai:gpt-5-mini",
+        )
+
+    monkeypatch.setattr(ConversationUsecase, "generate_reply", generate_reply)
+
+    response = await chat_usecase.chat("hi", conversation_id="conv-1")
+
+    assert response.content == "Answer"
+    assert response.message_id == "run-2"
+
+
+@pytest.mark.asyncio
+async def test_chat__with_on_delta_and_empty_stream__returns_failure(
+    chat_usecase: MCPChatUsecase, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def stream_reply(self, payload: ConversationRequest):
+        for delta in ("", ""):
+            yield ConversationStreamChunk(
+                conversation_id=payload.conversation_id,
+                message_id="run-3",
+                delta=delta,
+                model_key="openai:gpt-5-mini",
+            )
+
+    monkeypatch.setattr(ConversationUsecase, "stream_reply", stream_reply)
+
+    async def on_delta(delta: str) -> None:
+        return None
+
+    response = await chat_usecase.chat(
+        "hi", conversation_id="conv-1", on_delta=on_delta
+    )
+
+    assert response.success is False
+    assert response.content == ""
+    assert response.error